@@ -12,7 +12,7 @@ from bs4 import BeautifulSoup
 from .config import get_config
 from .utils import (
     setup_logging, extract_domain, find_next_page_url,
-    deduplicate_products, RateLimiter, RetrySession
+    deduplicate_products, RateLimiter, RetrySession, HTML_PARSER
 )
 from ..extractors.hybrid import HybridExtractor
 
@@ -77,7 +77,7 @@ class LuxcrepeScraper:
                     timeout=self.config.scraping.timeout
                 )
                 
-                soup = BeautifulSoup(response.text, "lxml")
+                soup = BeautifulSoup(response.text, HTML_PARSER)
                 base_url = extract_domain(current_url)
                 
                 # Extract products
@@ -135,7 +135,7 @@ class LuxcrepeScraper:
                 timeout=self.config.scraping.timeout
             )
             
-            soup = BeautifulSoup(response.text, "lxml")
+            soup = BeautifulSoup(response.text, HTML_PARSER)
             base_url = extract_domain(url)
             
             # Extract product data
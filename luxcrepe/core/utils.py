@@ -5,13 +5,29 @@ Utility functions for LuxCrepe scraper
 import re
 import time
 import json
+import uuid
 import hashlib
 import logging
-from typing import List, Dict, Any, Optional, Union, Set
+import numbers
+from dataclasses import fields, is_dataclass
+from datetime import date, time as dt_time
+from enum import Enum
+from typing import List, Dict, Any, Optional, Union, Set, Callable
 from urllib.parse import urljoin, urlparse
 import requests
 from bs4 import BeautifulSoup
 
+try:
+    import orjson
+except ImportError:  # optional C encoder, the stdlib json module is the fallback
+    orjson = None
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:  # optional C parser, BeautifulSoup's stdlib html.parser is the fallback
+    HTML_PARSER = "html.parser"
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,6 +43,46 @@ def setup_logging(level: str = "INFO") -> None:
     )
 
 
+def _json_default(obj: Any, default: Optional[Callable[[Any], Any]]) -> Any:
+    """Encode the types orjson handles natively the same way for the stdlib json module
+    
+    Used on both paths, so numeric types orjson does not know (NumPy scalars)
+    come out as numbers either way rather than going to the caller's default.
+    """
+    if isinstance(obj, (date, dt_time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    if isinstance(obj, numbers.Integral):
+        return int(obj)
+    if isinstance(obj, numbers.Real):
+        return float(obj)
+    if default is not None:
+        return default(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(obj: Any, indent: bool = True, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize to a JSON string, using orjson when it is installed
+    
+    The output is the same with and without orjson: datetimes as ISO 8601,
+    Enums as their values, dataclasses as objects and non-ASCII text as is.
+    """
+    def encode(o: Any) -> Any:
+        return _json_default(o, default)
+    
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=encode, option=option).decode()
+    if indent:
+        return json.dumps(obj, indent=2, default=encode, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), default=encode, ensure_ascii=False)
+
+
 def safe_extract_text(element, strip: bool = True) -> Optional[str]:
     """Safely extract text from BeautifulSoup element"""
     if not element:
@@ -13,7 +13,9 @@ import threading
 from dataclasses import dataclass, field
 from enum import Enum
 
-from ...base_agent import BaseAgent, MissionStatus, ThreatLevel, ReportPriority, SITREPReport, NineLine
+from ...base_agent import (
+    BaseAgent, MissionStatus, ThreatLevel, ReportPriority, SITREPReport, NineLine, message_handler
+)
 
 
 class MessageType(Enum):
@@ -128,16 +130,6 @@ class CommunicationsAgent(BaseAgent):
             "EMERGENCY_NET": []     # Emergency communications
         }
         
-        # Message processing
-        self.message_handlers: Dict[MessageType, Callable] = {
-            MessageType.SITREP: self._handle_sitrep,
-            MessageType.NINE_LINE: self._handle_nine_line,
-            MessageType.INTSUM: self._handle_intelligence_summary,
-            MessageType.EMERGENCY: self._handle_emergency,
-            MessageType.COMMAND_MSG: self._handle_command_message,
-            MessageType.STATUS_UPDATE: self._handle_status_update
-        }
-        
         # Start communications processing
         self._start_communications_processing()
         
@@ -489,8 +481,9 @@ class CommunicationsAgent(BaseAgent):
             await self._broadcast_message(message)
         
         # Handle specific message types
-        if message.message_type in self.message_handlers:
-            await self.message_handlers[message.message_type](message)
+        handler = self._message_handler_for(message.message_type)
+        if handler is not None:
+            await handler(message)
     
     async def _deliver_message_to_agent(self, agent_id: str, message: MilitaryMessage) -> None:
         """Deliver message to specific agent"""
@@ -533,6 +526,7 @@ class CommunicationsAgent(BaseAgent):
         
         return True
     
+    @message_handler(MessageType.SITREP)
     async def _handle_sitrep(self, message: MilitaryMessage) -> None:
         """Handle SITREP messages"""
         self.logger.info(f"RADIO: Processing SITREP from {message.from_agent}")
@@ -555,6 +549,7 @@ class CommunicationsAgent(BaseAgent):
                 )
                 await self._broadcast_message(relay_message)
     
+    @message_handler(MessageType.NINE_LINE)
     async def _handle_nine_line(self, message: MilitaryMessage) -> None:
         """Handle 9-Line emergency reports"""
         self.logger.warning(f"RADIO: Processing 9-Line emergency report from {message.from_agent}")
@@ -568,6 +563,7 @@ class CommunicationsAgent(BaseAgent):
             for agent in command_agents:
                 await self._deliver_message_to_agent(agent, message)
     
+    @message_handler(MessageType.INTSUM)
     async def _handle_intelligence_summary(self, message: MilitaryMessage) -> None:
         """Handle intelligence summary messages"""
         self.logger.info(f"RADIO: Processing INTSUM from {message.from_agent}")
@@ -578,6 +574,7 @@ class CommunicationsAgent(BaseAgent):
             if agent != message.from_agent:
                 await self._deliver_message_to_agent(agent, message)
     
+    @message_handler(MessageType.EMERGENCY)
     async def _handle_emergency(self, message: MilitaryMessage) -> None:
         """Handle emergency communications"""
         self.logger.error(f"RADIO: EMERGENCY MESSAGE from {message.from_agent}")
@@ -590,6 +587,7 @@ class CommunicationsAgent(BaseAgent):
         if emergency_type in self.emergency_procedures:
             await self.emergency_procedures[emergency_type](message)
     
+    @message_handler(MessageType.COMMAND_MSG)
     async def _handle_command_message(self, message: MilitaryMessage) -> None:
         """Handle command messages"""
         self.logger.info(f"RADIO: Processing COMMAND message from {message.from_agent}")
@@ -601,6 +599,7 @@ class CommunicationsAgent(BaseAgent):
             if agent != message.from_agent:
                 await self._deliver_message_to_agent(agent, message)
     
+    @message_handler(MessageType.STATUS_UPDATE)
     async def _handle_status_update(self, message: MilitaryMessage) -> None:
         """Handle status update messages"""
         self.logger.debug(f"RADIO: Processing status update from {message.from_agent}")
@@ -19,7 +19,7 @@ from urllib.parse import urlparse, urljoin, quote, unquote
 import json
 import re
 
-from ...base_agent import BaseAgent, MissionStatus, ThreatLevel, ReportPriority
+from ...base_agent import BaseAgent, MissionStatus, ThreatLevel, ReportPriority, DATACLASS_SLOTS
 from ....core.scraper import LuxcrepeScraper
 from ....core.utils import RetrySession, extract_domain
 
@@ -33,7 +33,7 @@ class StealthLevel(Enum):
     GHOST_MODE = "GHOST_MODE"          # Completely undetectable
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class StealthProfile:
     """Stealth operation profile"""
     profile_id: str
@@ -45,6 +45,57 @@ class StealthProfile:
     operational_windows: Dict[str, Any]
 
 
+# Stealth profile specifications, materialized per agent by get_stealth_profile.
+# A limit of None takes the agent's full user agent / evasion technique list.
+_STEALTH_PROFILE_SPECS: Dict[str, Dict[str, Any]] = {
+    "overt": {
+        "profile_id": "STEALTH_PROFILE_001",
+        "stealth_level": StealthLevel.OVERT,
+        "user_agent_limit": 2,
+        "request_patterns": {"timing": "NORMAL", "headers": "BASIC"},
+        "evasion_techniques": ("user_agent_rotation",),
+        "detection_countermeasures": ("basic_rate_limiting",),
+        "operational_windows": {"preferred": "ANYTIME", "avoid": "NONE"}
+    },
+    "passive": {
+        "profile_id": "STEALTH_PROFILE_002",
+        "stealth_level": StealthLevel.PASSIVE,
+        "user_agent_limit": 4,
+        "request_patterns": {"timing": "VARIED", "headers": "REALISTIC"},
+        "evasion_techniques": ("user_agent_rotation", "request_timing_variation"),
+        "detection_countermeasures": ("rate_limiting_evasion", "header_randomization"),
+        "operational_windows": {"preferred": "OFF_PEAK", "avoid": "PEAK_HOURS"}
+    },
+    "covert": {
+        "profile_id": "STEALTH_PROFILE_003",
+        "stealth_level": StealthLevel.COVERT,
+        "user_agent_limit": 6,
+        "request_patterns": {"timing": "HUMAN_LIKE", "headers": "COMPREHENSIVE"},
+        "evasion_techniques": ("user_agent_rotation", "request_timing_variation", "header_randomization", "session_management"),
+        "detection_countermeasures": ("rate_limiting_evasion", "captcha_avoidance", "bot_detection_evasion"),
+        "operational_windows": {"preferred": "LOW_TRAFFIC", "avoid": "BUSINESS_HOURS"}
+    },
+    "deep_cover": {
+        "profile_id": "STEALTH_PROFILE_004",
+        "stealth_level": StealthLevel.DEEP_COVER,
+        "user_agent_limit": 8,
+        "request_patterns": {"timing": "RANDOMIZED", "headers": "ADVANCED"},
+        "evasion_limit": 8,
+        "detection_countermeasures": ("advanced_evasion", "fingerprint_obfuscation", "behavioral_mimicry"),
+        "operational_windows": {"preferred": "MINIMAL_DETECTION_WINDOW", "avoid": "HIGH_SECURITY_PERIODS"}
+    },
+    "ghost_mode": {
+        "profile_id": "STEALTH_PROFILE_005",
+        "stealth_level": StealthLevel.GHOST_MODE,
+        "user_agent_limit": None,
+        "request_patterns": {"timing": "MAXIMUM_OBFUSCATION", "headers": "SPOOFED"},
+        "evasion_limit": None,
+        "detection_countermeasures": ("maximum_stealth", "complete_obfuscation", "anti_forensics"),
+        "operational_windows": {"preferred": "GHOST_WINDOW", "avoid": "ANY_MONITORING"}
+    }
+}
+
+
 class StealthTesterAgent(BaseAgent):
     """Stealth Tester Agent - Delta Overwatch Squad
     
@@ -86,7 +137,7 @@ class StealthTesterAgent(BaseAgent):
             "OPSEC_INDICATORS"
         ]
         
-        # Stealth operation data
+        # Stealth operation data - profiles are built on demand by get_stealth_profile
         self.stealth_profiles: Dict[str, StealthProfile] = {}
         self.operation_history: List[Dict[str, Any]] = []
         self.detection_events: List[Dict[str, Any]] = []
@@ -137,9 +188,6 @@ class StealthTesterAgent(BaseAgent):
             "behavior_analysis_scripts"
         ]
         
-        # Initialize stealth profiles
-        self._initialize_stealth_profiles()
-        
         self.logger.info("GHOST: Stealth Tester initialized - Going dark for covert operations")
     
     def get_capabilities(self) -> List[str]:
@@ -252,15 +300,15 @@ class StealthTesterAgent(BaseAgent):
         """Select appropriate stealth profile for operation level"""
         
         if stealth_level == StealthLevel.GHOST_MODE:
-            return self.stealth_profiles["ghost_mode"]
+            return self.get_stealth_profile("ghost_mode")
         elif stealth_level == StealthLevel.DEEP_COVER:
-            return self.stealth_profiles["deep_cover"]
+            return self.get_stealth_profile("deep_cover")
         elif stealth_level == StealthLevel.COVERT:
-            return self.stealth_profiles["covert"]
+            return self.get_stealth_profile("covert")
         elif stealth_level == StealthLevel.PASSIVE:
-            return self.stealth_profiles["passive"]
+            return self.get_stealth_profile("passive")
         else:
-            return self.stealth_profiles["overt"]
+            return self.get_stealth_profile("overt")
     
     async def _configure_evasion_systems(self, stealth_level: StealthLevel) -> Dict[str, Any]:
         """Configure evasion systems based on stealth level"""
@@ -1437,53 +1485,25 @@ class StealthTesterAgent(BaseAgent):
             "operation_completed_at": datetime.now().isoformat()
         }
     
-    def _initialize_stealth_profiles(self) -> None:
-        """Initialize stealth operation profiles"""
-        
-        self.stealth_profiles = {
-            "overt": StealthProfile(
-                profile_id="STEALTH_PROFILE_001",
-                stealth_level=StealthLevel.OVERT,
-                user_agents=self.stealth_user_agents[:2],
-                request_patterns={"timing": "NORMAL", "headers": "BASIC"},
-                evasion_techniques=["user_agent_rotation"],
-                detection_countermeasures=["basic_rate_limiting"],
-                operational_windows={"preferred": "ANYTIME", "avoid": "NONE"}
-            ),
-            "passive": StealthProfile(
-                profile_id="STEALTH_PROFILE_002",
-                stealth_level=StealthLevel.PASSIVE,
-                user_agents=self.stealth_user_agents[:4],
-                request_patterns={"timing": "VARIED", "headers": "REALISTIC"},
-                evasion_techniques=["user_agent_rotation", "request_timing_variation"],
-                detection_countermeasures=["rate_limiting_evasion", "header_randomization"],
-                operational_windows={"preferred": "OFF_PEAK", "avoid": "PEAK_HOURS"}
-            ),
-            "covert": StealthProfile(
-                profile_id="STEALTH_PROFILE_003",
-                stealth_level=StealthLevel.COVERT,
-                user_agents=self.stealth_user_agents[:6],
-                request_patterns={"timing": "HUMAN_LIKE", "headers": "COMPREHENSIVE"},
-                evasion_techniques=["user_agent_rotation", "request_timing_variation", "header_randomization", "session_management"],
-                detection_countermeasures=["rate_limiting_evasion", "captcha_avoidance", "bot_detection_evasion"],
-                operational_windows={"preferred": "LOW_TRAFFIC", "avoid": "BUSINESS_HOURS"}
-            ),
-            "deep_cover": StealthProfile(
-                profile_id="STEALTH_PROFILE_004",
-                stealth_level=StealthLevel.DEEP_COVER,
-                user_agents=self.stealth_user_agents[:8],
-                request_patterns={"timing": "RANDOMIZED", "headers": "ADVANCED"},
-                evasion_techniques=self.evasion_techniques[:8],
-                detection_countermeasures=["advanced_evasion", "fingerprint_obfuscation", "behavioral_mimicry"],
-                operational_windows={"preferred": "MINIMAL_DETECTION_WINDOW", "avoid": "HIGH_SECURITY_PERIODS"}
-            ),
-            "ghost_mode": StealthProfile(
-                profile_id="STEALTH_PROFILE_005",
-                stealth_level=StealthLevel.GHOST_MODE,
-                user_agents=self.stealth_user_agents,
-                request_patterns={"timing": "MAXIMUM_OBFUSCATION", "headers": "SPOOFED"},
-                evasion_techniques=self.evasion_techniques,
-                detection_countermeasures=["maximum_stealth", "complete_obfuscation", "anti_forensics"],
-                operational_windows={"preferred": "GHOST_WINDOW", "avoid": "ANY_MONITORING"}
+    def get_stealth_profile(self, name: str) -> StealthProfile:
+        """Return the named stealth profile, building it on first use"""
+        
+        profile = self.stealth_profiles.get(name)
+        if profile is None:
+            spec = _STEALTH_PROFILE_SPECS[name]
+            evasion_techniques = spec.get("evasion_techniques")
+            if evasion_techniques is None:
+                evasion_techniques = self.evasion_techniques[:spec["evasion_limit"]]
+            
+            profile = StealthProfile(
+                profile_id=spec["profile_id"],
+                stealth_level=spec["stealth_level"],
+                user_agents=self.stealth_user_agents[:spec["user_agent_limit"]],
+                request_patterns=dict(spec["request_patterns"]),
+                evasion_techniques=list(evasion_techniques),
+                detection_countermeasures=list(spec["detection_countermeasures"]),
+                operational_windows=dict(spec["operational_windows"])
             )
-        }
\ No newline at end of file
+            self.stealth_profiles[name] = profile
+        
+        return profile
\ No newline at end of file
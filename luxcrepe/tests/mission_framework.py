@@ -4,15 +4,21 @@ Mission Execution Framework for SEAL-Grade Multi-Agent Test Squad
 
 import asyncio
 import logging
+import sqlite3
 import time
-from typing import Dict, List, Any, Optional, Type
-from dataclasses import dataclass
+from abc import ABC, abstractmethod
+from collections import deque, OrderedDict
+from itertools import islice
+from typing import Dict, List, Any, Optional, Type, FrozenSet, Tuple, Mapping, Deque, Callable, Set, Iterable
+from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timedelta
 import json
 import uuid
+from types import MappingProxyType
 
-from .base_agent import BaseAgent, MissionStatus, ThreatLevel, ReportPriority
+from .base_agent import BaseAgent, MissionStatus, ThreatLevel, ReportPriority, DATACLASS_SLOTS
+from ..core.utils import dumps_json
 
 
 class MissionType(Enum):
@@ -31,7 +37,18 @@ class OperationSecurity(Enum):
     TOP_SECRET = "TOP_SECRET"
 
 
-@dataclass
+# Agent status buckets reported by get_operational_status
+_DEPLOYED_STATES = frozenset({
+    MissionStatus.INFIL,
+    MissionStatus.TARGET,
+    MissionStatus.ASSAULT,
+    MissionStatus.CONSOLIDATE,
+    MissionStatus.EXFIL
+})
+_FAILED_STATES = frozenset({MissionStatus.FAILED, MissionStatus.ABORT})
+
+
+@dataclass(**DATACLASS_SLOTS)
 class MissionParameters:
     """Mission parameters and configuration"""
     mission_id: str
@@ -45,53 +62,289 @@ class MissionParameters:
     threat_assessment: Dict[str, Any]
     rules_of_engagement: Dict[str, Any]
     extraction_plan: Dict[str, Any]
+    # resources_required as a set, computed once for capability validation
+    required_capabilities: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    
+    # Read-only view of the serialized parameters, built on first use
+    _dict_cache: Optional[Mapping[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.required_capabilities = frozenset(self.resources_required)
+    
+    @property
+    def as_dict(self) -> Mapping[str, Any]:
+        """Read-only dictionary view, built once and shared by every caller
+        
+        Parameters are treated as fixed once a mission is dispatched; the view
+        is not rebuilt if fields are reassigned afterwards.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = MappingProxyType({
+                "mission_id": self.mission_id,
+                "mission_type": self.mission_type.value,
+                "target_system": self.target_system,
+                "objectives": self.objectives,
+                "success_criteria": self.success_criteria,
+                "time_limit_minutes": self.time_limit.total_seconds() / 60,
+                "security_level": self.security_level.value,
+                "resources_required": self.resources_required,
+                "threat_assessment": self.threat_assessment,
+                "rules_of_engagement": self.rules_of_engagement,
+                "extraction_plan": self.extraction_plan
+            })
+        return self._dict_cache
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
+        return dict(self.as_dict)
+
+
+@dataclass(**DATACLASS_SLOTS)
+class MissionRecord:
+    """Orchestrator-side tracking record of a dispatched mission"""
+    id: str
+    parameters: MissionParameters
+    agents: List[str]
+    start_time: datetime
+    start_time_ns: int                 # perf_counter_ns at dispatch, for execution_time
+    status: Optional[str] = None       # ACTIVE, COMPLETED or FAILED
+    results: Dict[str, Any] = field(default_factory=dict)
+    threat_level: ThreatLevel = ThreatLevel.GREEN
+    execution_time: Optional[float] = None
+    error: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary suitable for persisting in a MissionStore"""
         return {
-            "mission_id": self.mission_id,
-            "mission_type": self.mission_type.value,
-            "target_system": self.target_system,
-            "objectives": self.objectives,
-            "success_criteria": self.success_criteria,
-            "time_limit_minutes": self.time_limit.total_seconds() / 60,
-            "security_level": self.security_level.value,
-            "resources_required": self.resources_required,
-            "threat_assessment": self.threat_assessment,
-            "rules_of_engagement": self.rules_of_engagement,
-            "extraction_plan": self.extraction_plan
+            "mission_id": self.id,
+            "mission_type": self.parameters.mission_type.value,
+            "status": self.status,
+            "agents": list(self.agents),
+            "start_time": self.start_time.isoformat(),
+            "threat_level": self.threat_level.value,
+            "execution_time": self.execution_time,
+            "error": self.error,
+            "results": self.results
         }
 
 
+class MissionStore(ABC):
+    """Persistent storage for mission records outside the orchestrator process"""
+    
+    @abstractmethod
+    async def put(self, mission_id: str, record: Dict[str, Any]) -> None:
+        """Insert or replace the stored record of a mission"""
+        pass
+    
+    @abstractmethod
+    async def get(self, mission_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch the stored record of a mission, or None if unknown"""
+        pass
+
+
+class SQLiteMissionStore(MissionStore):
+    """MissionStore backed by an SQLite database in WAL mode
+    
+    sqlite3 calls are blocking, so they run on the loop's default executor
+    behind a lock that serializes access to the single connection.
+    """
+    
+    def __init__(self, path: str = "missions.db"):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS missions (mission_id TEXT PRIMARY KEY, record TEXT NOT NULL)"
+        )
+        self._conn.commit()
+        # Created in the loop that uses it, see _loop_lock
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _loop_lock(self) -> asyncio.Lock:
+        """Return the connection lock for the running loop
+        
+        Before Python 3.10 a lock binds to the loop current at creation, so it
+        is created on first use and again if the store moves to another loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+    
+    def _put_sync(self, mission_id: str, payload: str) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO missions VALUES (?, ?)", (mission_id, payload))
+        self._conn.commit()
+    
+    def _get_sync(self, mission_id: str) -> Optional[str]:
+        row = self._conn.execute("SELECT record FROM missions WHERE mission_id = ?", (mission_id,)).fetchone()
+        return row[0] if row else None
+    
+    async def put(self, mission_id: str, record: Dict[str, Any]) -> None:
+        payload = dumps_json(record, indent=False, default=str)
+        async with self._loop_lock():
+            await asyncio.get_running_loop().run_in_executor(None, self._put_sync, mission_id, payload)
+    
+    async def get(self, mission_id: str) -> Optional[Dict[str, Any]]:
+        async with self._loop_lock():
+            payload = await asyncio.get_running_loop().run_in_executor(None, self._get_sync, mission_id)
+        return json.loads(payload) if payload is not None else None
+    
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        self._conn.close()
+
+
 class MissionOrchestrator:
     """Orchestrates multi-agent missions"""
     
-    def __init__(self):
+    # Seconds a status snapshot is served from cache to polling clients
+    operational_status_ttl: float = 1.0
+    mission_status_ttl: float = 0.5
+    
+    def __init__(self, mission_workers: int = 1, max_completed: int = 1024,
+                 on_mission_evicted: Optional[Callable[["MissionRecord"], None]] = None,
+                 store: Optional[MissionStore] = None):
         self.logger = logging.getLogger("SEAL.COMMAND")
-        self.active_missions: Dict[str, Dict[str, Any]] = {}
+        # Optional persistent store; writes are fire-and-forget background tasks
+        self.store = store
+        self._store_tasks: Set[asyncio.Task] = set()
+        # Missions in completion order; only the newest max_completed finished
+        # missions are retained, older ones are evicted by _evict_old_missions
+        self.active_missions: "OrderedDict[str, MissionRecord]" = OrderedDict()
+        self.max_completed = max_completed
+        self.on_mission_evicted = on_mission_evicted
+        self._mission_status_counts: Dict[str, int] = {"ACTIVE": 0, "COMPLETED": 0, "FAILED": 0}
         self.agent_registry: Dict[str, BaseAgent] = {}
-        self.squad_organization: Dict[str, List[str]] = {
-            "alpha": [],
-            "bravo": [],
-            "charlie": [],
-            "delta": []
+        self._agent_capabilities: Dict[str, FrozenSet[str]] = {}
+        self.squad_organization: Dict[str, Deque[str]] = {
+            "alpha": deque(),
+            "bravo": deque(),
+            "charlie": deque(),
+            "delta": deque()
+        }
+        
+        # Mission type -> squad selection plan used by _auto_select_agents
+        self._selection_strategies: Dict[MissionType, Callable[[], List[Optional[str]]]] = {
+            MissionType.DIRECT_ACTION: self._select_direct_action,
+            MissionType.SPECIAL_RECON: self._select_special_recon,
+            MissionType.UNCONVENTIONAL_WARFARE: self._select_unconventional_warfare
         }
         
+        # Background mission queue, created on the first submit_mission call
+        self.mission_workers = mission_workers
+        self._mission_queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        
+        # (method name, mission ID) -> (expiry in monotonic ns, status snapshot)
+        self._status_cache: Dict[Tuple[str, Optional[str]], Tuple[int, Any]] = {}
+        
+    @classmethod
+    def install_uvloop(cls) -> bool:
+        """Opt in to uvloop's event loop policy for faster task creation and timers
+        
+        Must be called before the event loop that runs missions is created.
+        Returns False, leaving the default loop in place, if uvloop is missing.
+        """
+        try:
+            import uvloop
+        except ImportError:
+            logging.getLogger("SEAL.COMMAND").warning("LOOP: uvloop not installed, using default event loop")
+            return False
+        
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return True
+    
     def register_agent(self, agent: BaseAgent) -> None:
         """Register an agent with the command structure"""
         self.agent_registry[agent.agent_id] = agent
+        self._agent_capabilities[agent.agent_id] = frozenset(agent.get_capabilities())
         squad = agent.squad.lower()
-        if squad in self.squad_organization:
-            self.squad_organization[squad].append(agent.agent_id)
+        self.squad_organization.setdefault(squad, deque()).append(agent.agent_id)
+        self._status_cache.clear()
+        
+        self.logger.info("REGISTRY: Agent %s registered in %s squad", agent.call_sign, squad)
+    
+    def invalidate_capabilities(self, agent_id: str) -> None:
+        """Refresh the cached capability set of an agent whose capabilities changed"""
+        agent = self.agent_registry.get(agent_id)
+        if agent is not None:
+            self._agent_capabilities[agent_id] = frozenset(agent.get_capabilities())
+    
+    def _is_tracked(self, record: MissionRecord) -> bool:
+        """Whether a record is the one tracked under its mission ID
         
-        self.logger.info(f"REGISTRY: Agent {agent.call_sign} registered in {squad} squad")
+        Re-running a mission ID replaces its record; the replaced record is
+        detached and no longer counted, persisted or evicted.
+        """
+        return self.active_missions.get(record.id) is record
+    
+    def _set_mission_status(self, record: MissionRecord, status: str) -> None:
+        """Transition a mission and keep the status counters in step"""
+        if self._is_tracked(record):
+            previous = record.status
+            if previous is not None:
+                self._mission_status_counts[previous] -= 1
+            self._mission_status_counts[status] += 1
+            self._status_cache.clear()
+        record.status = status
+    
+    def _finish_mission(self, record: MissionRecord, status: str) -> None:
+        """Mark a mission COMPLETED/FAILED and evict the oldest finished ones"""
+        self._set_mission_status(record, status)
+        record.execution_time = (time.perf_counter_ns() - record.start_time_ns) / 1e9
+        if not self._is_tracked(record):
+            # Superseded by a re-run of the same mission ID
+            return
+        self.active_missions.move_to_end(record.id)
+        self._persist_mission(record)
+        self._evict_old_missions()
+    
+    def _persist_mission(self, record: MissionRecord) -> None:
+        """Write a mission record to the store without waiting for the I/O"""
+        if self.store is None:
+            return
+        
+        task = asyncio.create_task(self.store.put(record.id, record.to_dict()))
+        self._store_tasks.add(task)
+        task.add_done_callback(self._store_write_done)
+    
+    def _store_write_done(self, task: asyncio.Task) -> None:
+        self._store_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error("ARCHIVE: Mission store write failed: %s", task.exception())
+    
+    async def flush_store(self) -> None:
+        """Wait for outstanding mission store writes to finish"""
+        if self._store_tasks:
+            await asyncio.gather(*self._store_tasks, return_exceptions=True)
+    
+    def _evict_old_missions(self) -> None:
+        """Drop the oldest finished missions until at most max_completed remain"""
+        active_missions = self.active_missions
+        excess = len(active_missions) - self._mission_status_counts["ACTIVE"] - self.max_completed
+        if excess <= 0:
+            return
+        
+        # Active missions are never evicted, they are skipped over; stop at the excess
+        evicted = list(islice((mission_id for mission_id, record in active_missions.items()
+                               if record.status != "ACTIVE"), excess))
+        for mission_id in evicted:
+            record = active_missions.pop(mission_id)
+            self._mission_status_counts[record.status] -= 1
+            if self.on_mission_evicted is not None:
+                self.on_mission_evicted(record)
+            else:
+                self.logger.debug("ARCHIVE: Mission %s evicted (%s, %.2fs)", mission_id,
+                                  record.status, record.execution_time or 0.0)
     
     async def execute_mission(self, mission_params: MissionParameters, 
                             selected_agents: Optional[List[str]] = None) -> Dict[str, Any]:
         """Execute a mission with specified or auto-selected agents"""
         
         mission_id = mission_params.mission_id
-        self.logger.info(f"MISSION START: Initiating mission {mission_id}")
+        self.logger.info("MISSION START: Initiating mission %s", mission_id)
         
         # Auto-select agents if not specified
         if not selected_agents:
@@ -106,41 +359,44 @@ class MissionOrchestrator:
             }
         
         # Initialize mission tracking
-        mission_data = {
-            "id": mission_id,
-            "parameters": mission_params,
-            "agents": selected_agents,
-            "start_time": datetime.now(),
-            "status": "ACTIVE",
-            "results": {},
-            "threat_level": ThreatLevel.GREEN
-        }
-        self.active_missions[mission_id] = mission_data
+        record = MissionRecord(
+            id=mission_id,
+            parameters=mission_params,
+            agents=selected_agents,
+            start_time=datetime.now(),
+            start_time_ns=time.perf_counter_ns()
+        )
+        previous_mission = self.active_missions.get(mission_id)
+        if previous_mission is not None:
+            # Re-running a mission ID replaces its record, so retire the old count;
+            # the old record is detached and its own finish no longer touches the counters
+            self._mission_status_counts[previous_mission.status] -= 1
+        self.active_missions[mission_id] = record
+        self._set_mission_status(record, "ACTIVE")
+        self._persist_mission(record)
         
         try:
             # Execute mission phases
             results = await self._execute_mission_phases(mission_params, selected_agents)
             
-            mission_data["status"] = "COMPLETED"
-            mission_data["end_time"] = datetime.now()
-            mission_data["results"] = results
+            record.results = results
+            self._finish_mission(record, "COMPLETED")
             
-            self.logger.info(f"MISSION SUCCESS: Mission {mission_id} completed successfully")
+            self.logger.info("MISSION SUCCESS: Mission %s completed successfully", mission_id)
             
             return {
                 "status": "SUCCESS",
                 "mission_id": mission_id,
                 "results": results,
-                "execution_time": (mission_data["end_time"] - mission_data["start_time"]).total_seconds(),
+                "execution_time": record.execution_time,
                 "agents_deployed": len(selected_agents)
             }
             
         except Exception as e:
-            mission_data["status"] = "FAILED" 
-            mission_data["error"] = str(e)
-            mission_data["end_time"] = datetime.now()
+            record.error = str(e)
+            self._finish_mission(record, "FAILED")
             
-            self.logger.error(f"MISSION FAILED: Mission {mission_id} failed: {str(e)}")
+            self.logger.error("MISSION FAILED: Mission %s failed: %s", mission_id, str(e))
             
             # Execute emergency extraction
             await self._emergency_extraction(selected_agents)
@@ -152,6 +408,49 @@ class MissionOrchestrator:
                 "agents_deployed": len(selected_agents)
             }
     
+    async def submit_mission(self, mission_params: MissionParameters,
+                             selected_agents: Optional[List[str]] = None) -> str:
+        """Queue a mission for background execution and return its mission ID
+        
+        Queued missions are run by ``mission_workers`` worker tasks on the current
+        event loop; progress is visible through ``get_mission_status`` once a
+        worker picks the mission up.
+        """
+        if self._mission_queue is None:
+            self._mission_queue = asyncio.Queue()
+            self._worker_tasks = [
+                asyncio.create_task(self._mission_worker())
+                for _ in range(self.mission_workers)
+            ]
+        
+        await self._mission_queue.put((mission_params, selected_agents))
+        self.logger.info("MISSION QUEUED: Mission %s queued for execution", mission_params.mission_id)
+        return mission_params.mission_id
+    
+    async def drain_missions(self) -> None:
+        """Wait until every queued mission has been executed"""
+        if self._mission_queue is not None:
+            await self._mission_queue.join()
+    
+    async def stop_mission_workers(self) -> None:
+        """Cancel the background mission workers"""
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        self._mission_queue = None
+    
+    async def _mission_worker(self) -> None:
+        """Execute queued missions one at a time"""
+        while True:
+            mission_params, selected_agents = await self._mission_queue.get()
+            try:
+                await self.execute_mission(mission_params, selected_agents)
+            except Exception as e:
+                self.logger.error("MISSION QUEUE: Mission %s raised: %s", mission_params.mission_id, e)
+            finally:
+                self._mission_queue.task_done()
+    
     def _auto_select_agents(self, mission_params: MissionParameters) -> List[str]:
         """Automatically select optimal agents for mission"""
         selected = []
@@ -162,22 +461,9 @@ class MissionOrchestrator:
             selected.append(alpha_agents[0])  # Mission commander
         
         # Select agents based on mission type
-        if mission_params.mission_type == MissionType.DIRECT_ACTION:
-            # Bravo team for direct action
-            bravo_agents = self.squad_organization["bravo"]
-            selected.extend(bravo_agents[:2])  # Pointman + Assault
-            
-        elif mission_params.mission_type == MissionType.SPECIAL_RECON:
-            # Charlie team for specialized operations
-            charlie_agents = self.squad_organization["charlie"]
-            selected.extend(charlie_agents[:2])  # Engineer + Sniper
-            
-        elif mission_params.mission_type == MissionType.UNCONVENTIONAL_WARFARE:
-            # Mixed team for adversarial testing
-            bravo_agents = self.squad_organization["bravo"]
-            charlie_agents = self.squad_organization["charlie"]
-            selected.append(bravo_agents[1] if len(bravo_agents) > 1 else bravo_agents[0])  # Breacher
-            selected.append(charlie_agents[0] if charlie_agents else None)  # Demolitions
+        strategy = self._selection_strategies.get(mission_params.mission_type)
+        if strategy is not None:
+            selected.extend(strategy())
         
         # Always include Delta overwatch
         delta_agents = self.squad_organization["delta"]
@@ -187,29 +473,56 @@ class MissionOrchestrator:
         # Filter out None values
         selected = [agent_id for agent_id in selected if agent_id is not None]
         
-        self.logger.info(f"AUTO-SELECT: Selected agents {selected} for mission type {mission_params.mission_type.value}")
+        self.logger.info("AUTO-SELECT: Selected agents %s for mission type %s", selected, mission_params.mission_type.value)
         return selected
     
+    def _select_direct_action(self) -> List[str]:
+        """Bravo team for direct action"""
+        bravo_agents = self.squad_organization["bravo"]
+        selected = list(islice(bravo_agents, 2))  # Pointman + Assault
+        bravo_agents.rotate(-1)  # Round-robin so the whole squad shares the load
+        return selected
+    
+    def _select_special_recon(self) -> List[str]:
+        """Charlie team for specialized operations"""
+        charlie_agents = self.squad_organization["charlie"]
+        selected = list(islice(charlie_agents, 2))  # Engineer + Sniper
+        charlie_agents.rotate(-1)
+        return selected
+    
+    def _select_unconventional_warfare(self) -> List[Optional[str]]:
+        """Mixed team for adversarial testing"""
+        bravo_agents = self.squad_organization["bravo"]
+        charlie_agents = self.squad_organization["charlie"]
+        return [
+            bravo_agents[1] if len(bravo_agents) > 1 else bravo_agents[0],  # Breacher
+            charlie_agents[0] if charlie_agents else None  # Demolitions
+        ]
+    
     def _validate_agent_selection(self, agent_ids: List[str], 
                                 mission_params: MissionParameters) -> bool:
         """Validate that selected agents can fulfill mission requirements"""
         
-        # Check all agents exist and are available
+        # Single pass: every agent must exist and be available, while the squad
+        # composition and capability union are collected along the way
+        agent_registry = self.agent_registry
+        agent_capabilities = self._agent_capabilities
+        standby = MissionStatus.STANDBY
+        squads_represented = set()
+        add_squad = squads_represented.add
+        available_capabilities = set()
         for agent_id in agent_ids:
-            if agent_id not in self.agent_registry:
-                self.logger.error(f"VALIDATION: Agent {agent_id} not found in registry")
+            agent = agent_registry.get(agent_id)
+            if agent is None:
+                self.logger.error("VALIDATION: Agent %s not found in registry", agent_id)
                 return False
             
-            agent = self.agent_registry[agent_id]
-            if agent.status != MissionStatus.STANDBY:
-                self.logger.error(f"VALIDATION: Agent {agent.call_sign} not available (status: {agent.status})")
+            if agent.status is not standby:
+                self.logger.error("VALIDATION: Agent %s not available (status: %s)", agent.call_sign, agent.status)
                 return False
-        
-        # Check minimum team composition
-        squads_represented = set()
-        for agent_id in agent_ids:
-            agent = self.agent_registry[agent_id]
-            squads_represented.add(agent.squad.lower())
+            
+            add_squad(agent.squad.lower())
+            available_capabilities |= agent_capabilities[agent_id]
         
         # Must have at least command (alpha) and one operational squad
         if "alpha" not in squads_represented:
@@ -217,16 +530,9 @@ class MissionOrchestrator:
             return False
         
         # Check mission-specific requirements
-        required_capabilities = mission_params.resources_required
-        available_capabilities = set()
-        
-        for agent_id in agent_ids:
-            agent = self.agent_registry[agent_id]
-            available_capabilities.update(agent.get_capabilities())
-        
-        missing_capabilities = set(required_capabilities) - available_capabilities
+        missing_capabilities = mission_params.required_capabilities - available_capabilities
         if missing_capabilities:
-            self.logger.error(f"VALIDATION: Missing required capabilities: {missing_capabilities}")
+            self.logger.error("VALIDATION: Missing required capabilities: %s", set(missing_capabilities))
             return False
         
         self.logger.info("VALIDATION: Agent selection validated successfully")
@@ -238,50 +544,52 @@ class MissionOrchestrator:
         
         agents = [self.agent_registry[agent_id] for agent_id in agent_ids]
         
-        # Convert mission parameters to dict for agents
-        mission_dict = mission_params.to_dict()
+        # One read-only payload shared by every agent
+        mission_dict = mission_params.as_dict
         
         # Deploy all agents concurrently
-        self.logger.info(f"DEPLOY: Deploying {len(agents)} agents for mission {mission_params.mission_id}")
-        
-        deployment_tasks = []
-        for agent in agents:
-            task = asyncio.create_task(
-                agent.deploy(mission_params.mission_id, mission_dict),
-                name=f"deploy_{agent.call_sign}"
-            )
-            deployment_tasks.append(task)
-        
-        # Wait for all agents to complete with timeout
+        mission_id = mission_params.mission_id
+        self.logger.info("DEPLOY: Deploying %s agents for mission %s", len(agents), mission_id)
+        
+        deploy_agent = self._deploy_agent
+        create_task = asyncio.create_task
+        deploy_coros = tuple(deploy_agent(agent, mission_id, mission_dict) for agent in agents)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Named tasks make stuck deployments identifiable in task dumps
+            deployment_tasks = [
+                create_task(coro, name=f"deploy_{agent.call_sign}")
+                for agent, coro in zip(agents, deploy_coros)
+            ]
+        else:
+            deployment_tasks = [create_task(coro) for coro in deploy_coros]
+        pending_tasks = set(deployment_tasks)
+        
+        # Process results as agents report in, bounded by the mission time limit
         timeout_seconds = mission_params.time_limit.total_seconds()
+        mission_results = {
+            "agents": {},
+            "overall_success": True,
+            "total_agents": len(agents),
+            "successful_agents": 0,
+            "failed_agents": 0
+        }
         
+        agent_reports = mission_results["agents"]
+        discard_pending = pending_tasks.discard
         try:
-            results = await asyncio.wait_for(
-                asyncio.gather(*deployment_tasks, return_exceptions=True),
-                timeout=timeout_seconds
-            )
-            
-            # Process results
-            mission_results = {
-                "agents": {},
-                "overall_success": True,
-                "total_agents": len(agents),
-                "successful_agents": 0,
-                "failed_agents": 0
-            }
-            
-            for i, result in enumerate(results):
-                agent = agents[i]
+            for next_report in asyncio.as_completed(deployment_tasks, timeout=timeout_seconds):
+                task, agent, result = await next_report
+                discard_pending(task)
                 
                 if isinstance(result, Exception):
-                    mission_results["agents"][agent.call_sign] = {
+                    agent_reports[agent.call_sign] = {
                         "status": "FAILED",
                         "error": str(result)
                     }
                     mission_results["failed_agents"] += 1
                     mission_results["overall_success"] = False
                 else:
-                    mission_results["agents"][agent.call_sign] = result
+                    agent_reports[agent.call_sign] = result
                     if result.get("status") == "SUCCESS":
                         mission_results["successful_agents"] += 1
                     else:
@@ -291,86 +599,154 @@ class MissionOrchestrator:
             return mission_results
             
         except asyncio.TimeoutError:
-            self.logger.error(f"TIMEOUT: Mission {mission_params.mission_id} exceeded time limit")
+            self.logger.error("TIMEOUT: Mission %s exceeded time limit", mission_id)
             
-            # Cancel remaining tasks
-            for task in deployment_tasks:
-                if not task.done():
-                    task.cancel()
+            # Cancel the agents that have not reported
+            for task in pending_tasks:
+                task.cancel()
             
             raise Exception(f"Mission timeout after {timeout_seconds} seconds")
     
+    @staticmethod
+    async def _deploy_agent(agent: BaseAgent, mission_id: str,
+                            mission_dict: Mapping[str, Any]) -> Tuple[asyncio.Task, BaseAgent, Any]:
+        """Deploy one agent, returning its task and agent alongside the result or exception"""
+        try:
+            result = await agent.deploy(mission_id, mission_dict)
+        except Exception as e:
+            result = e
+        return asyncio.current_task(), agent, result
+    
     async def _emergency_extraction(self, agent_ids: List[str]) -> None:
         """Execute emergency extraction for failed mission"""
         self.logger.warning("EMERGENCY EXTRACTION: Initiating emergency extraction procedures")
         
+        agent_registry = self.agent_registry
+        warning = self.logger.warning
         for agent_id in agent_ids:
-            if agent_id in self.agent_registry:
-                agent = self.agent_registry[agent_id]
-                agent.status = MissionStatus.ABORT
-                agent.threat_level = ThreatLevel.RED
-                
-                self.logger.warning(f"EXTRACT: Agent {agent.call_sign} set to abort status")
+            agent = agent_registry.get(agent_id)
+            if agent is None:
+                continue
+            
+            agent.status = MissionStatus.ABORT
+            agent.threat_level = ThreatLevel.RED
+            
+            warning("EXTRACT: Agent %s set to abort status", agent.call_sign)
+        self._status_cache.clear()
         
         # Allow time for agents to abort safely
         await asyncio.sleep(1.0)
         
         self.logger.info("EMERGENCY EXTRACTION: Extraction complete")
     
+    def _cached_status(self, key: Tuple[str, Optional[str]], ttl: float,
+                       compute: Callable[[], Any]) -> Any:
+        """Serve a status snapshot from the TTL cache, recomputing it when expired
+        
+        Snapshots are shared between callers until they expire, so treat them
+        as read-only.
+        """
+        now = time.monotonic_ns()
+        cached = self._status_cache.get(key)
+        if cached is not None and now < cached[0]:
+            return cached[1]
+        
+        result = compute()
+        self._status_cache[key] = (now + int(ttl * 1e9), result)
+        return result
+    
     def get_mission_status(self, mission_id: str) -> Optional[Dict[str, Any]]:
-        """Get status of specific mission"""
-        if mission_id in self.active_missions:
-            mission_data = self.active_missions[mission_id]
-            
-            # Get agent statuses
-            agent_statuses = {}
-            for agent_id in mission_data["agents"]:
-                if agent_id in self.agent_registry:
-                    agent = self.agent_registry[agent_id]
-                    agent_statuses[agent.call_sign] = agent.get_mission_status()
-            
-            return {
-                "mission_id": mission_id,
-                "status": mission_data["status"],
-                "start_time": mission_data["start_time"].isoformat(),
-                "threat_level": mission_data["threat_level"].value,
-                "agents": agent_statuses
-            }
-        
-        return None
+        """Get status of specific mission
+        
+        The mission record part is served from the TTL cache, agent statuses
+        are read fresh since agents change state without touching the record.
+        """
+        cached = self._cached_status(("mission", mission_id), self.mission_status_ttl,
+                                     lambda: self._compute_mission_status(mission_id))
+        if cached is None:
+            return None
+        record_status, agent_ids = cached
+        return {**record_status, "agents": self._agent_statuses(agent_ids)}
+    
+    async def load_mission_record(self, mission_id: str) -> Optional[Dict[str, Any]]:
+        """Get the record of a mission, falling back to the store once evicted"""
+        record = self.active_missions.get(mission_id)
+        if record is not None:
+            return record.to_dict()
+        if self.store is None:
+            return None
+        return await self.store.get(mission_id)
+    
+    def _compute_mission_status(self, mission_id: str) -> Optional[Tuple[Dict[str, Any], Tuple[str, ...]]]:
+        record = self.active_missions.get(mission_id)
+        if record is None:
+            return None
+        
+        record_status = {
+            "mission_id": mission_id,
+            "status": record.status,
+            "start_time": record.start_time.isoformat(),
+            "threat_level": record.threat_level.value
+        }
+        return record_status, tuple(record.agents)
+    
+    def _agent_statuses(self, agent_ids: Iterable[str]) -> Dict[str, Any]:
+        agent_registry = self.agent_registry
+        agent_statuses = {}
+        for agent_id in agent_ids:
+            agent = agent_registry.get(agent_id)
+            if agent is not None:
+                agent_statuses[agent.call_sign] = agent.get_mission_status()
+        return agent_statuses
     
     def get_operational_status(self) -> Dict[str, Any]:
-        """Get overall operational status"""
+        """Get overall operational status
         
+        Agent counts are taken fresh, the rest is served from the TTL cache.
+        """
+        status = self._cached_status(("operational", None), self.operational_status_ttl,
+                                     self._compute_operational_status)
+        return {
+            "timestamp": status["timestamp"],
+            "command_status": status["command_status"],
+            "agents": self._agent_counts(),
+            "missions": status["missions"],
+            "squad_organization": status["squad_organization"]
+        }
+    
+    def _agent_counts(self) -> Dict[str, int]:
         # Count agents by status
-        agent_counts = {
+        standby_state = MissionStatus.STANDBY
+        deployed_states = _DEPLOYED_STATES
+        failed_states = _FAILED_STATES
+        standby = deployed = failed = 0
+        for agent in self.agent_registry.values():
+            status = agent.status
+            if status is standby_state:
+                standby += 1
+            elif status in deployed_states:
+                deployed += 1
+            elif status in failed_states:
+                failed += 1
+        
+        return {
             "total": len(self.agent_registry),
-            "standby": 0,
-            "deployed": 0,
-            "failed": 0
+            "standby": standby,
+            "deployed": deployed,
+            "failed": failed
         }
-        
-        for agent in self.agent_registry.values():
-            if agent.status == MissionStatus.STANDBY:
-                agent_counts["standby"] += 1
-            elif agent.status in [MissionStatus.INFIL, MissionStatus.TARGET, 
-                                MissionStatus.ASSAULT, MissionStatus.CONSOLIDATE, 
-                                MissionStatus.EXFIL]:
-                agent_counts["deployed"] += 1
-            elif agent.status in [MissionStatus.FAILED, MissionStatus.ABORT]:
-                agent_counts["failed"] += 1
-        
-        # Mission counts
+    
+    def _compute_operational_status(self) -> Dict[str, Any]:
+        # Mission counts are maintained incrementally by _set_mission_status
         mission_counts = {
-            "active": len([m for m in self.active_missions.values() if m["status"] == "ACTIVE"]),
-            "completed": len([m for m in self.active_missions.values() if m["status"] == "COMPLETED"]),
-            "failed": len([m for m in self.active_missions.values() if m["status"] == "FAILED"])
+            "active": self._mission_status_counts["ACTIVE"],
+            "completed": self._mission_status_counts["COMPLETED"],
+            "failed": self._mission_status_counts["FAILED"]
         }
         
         return {
             "timestamp": datetime.now().isoformat(),
             "command_status": "OPERATIONAL",
-            "agents": agent_counts,
             "missions": mission_counts,
             "squad_organization": {
                 squad: len(agents) for squad, agents in self.squad_organization.items()
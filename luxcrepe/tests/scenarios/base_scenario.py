@@ -3,17 +3,193 @@ Base Test Scenario - SEADOG Military Testing Framework
 Foundation for all test scenarios and validation protocols
 """
 
+import os
+import sys
 import asyncio
 import logging
+import logging.handlers
 import time
-import json
+from array import array
+from operator import attrgetter
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Union, Tuple
+from typing import Dict, Any, List, Optional, Union, Tuple, Callable, AsyncIterator, Iterable, Mapping
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 
-from ..base_agent import BaseAgent, MissionStatus, ThreatLevel, ReportPriority
+import numpy as np
+
+from ..base_agent import BaseAgent, MissionStatus, ThreatLevel, ReportPriority, DATACLASS_SLOTS
+from ...core.utils import dumps_json
+
+# Tasks can start eagerly (run synchronously until their first suspension)
+# from Python 3.12 on, skipping a loop iteration for missions that never block
+_EAGER_TASK_START = sys.version_info >= (3, 12)
+
+# Below this many agents the NumPy setup cost outweighs vectorized reductions
+_NUMPY_MIN_AGENTS = 64
+
+# Agent report statuses and recommendation codes shared by every result
+_STATUS_COMPLETED = sys.intern("COMPLETED")
+_STATUS_FAILED = sys.intern("FAILED")
+_STATUS_TIMEOUT = sys.intern("TIMEOUT")
+_REC_IMPROVE_RELIABILITY = sys.intern("IMPROVE_AGENT_RELIABILITY")
+_REC_OPTIMIZE_PERFORMANCE = sys.intern("OPTIMIZE_AGENT_PERFORMANCE")
+_REC_INVESTIGATE_FAILURES = sys.intern("INVESTIGATE_AGENT_FAILURES")
+_REC_ADDRESS_VALIDATION = sys.intern("ADDRESS_VALIDATION_ISSUES")
+_REC_IMPROVE_COMPLIANCE = sys.intern("IMPROVE_COMPLIANCE_ADHERENCE")
+
+# Success criterion key -> check(metrics, criterion value, agent_results);
+# keys without an entry are not evaluated
+_CRITERIA_EVALUATORS: Dict[str, Callable[[Dict[str, Any], Any, List[Dict[str, Any]]], bool]] = {
+    "min_success_rate": lambda metrics, value, _: metrics["success_rate"] >= value,
+    "max_execution_time": lambda metrics, value, _: metrics["average_execution_time"] <= value,
+    "required_agents": lambda metrics, value, _: metrics["successful_agents"] >= value
+}
+
+
+class _ParentLoggerHandler(logging.Handler):
+    """Hand records to the handlers of a logger's ancestors, as propagation would"""
+    
+    def __init__(self, logger: logging.Logger):
+        super().__init__()
+        self.parent = logger.parent
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        self.parent.handle(record)
+
+
+class _ScenarioLogBuffer(logging.handlers.MemoryHandler):
+    """Batch a scenario logger's records in memory instead of propagating each one
+    
+    Records are flushed to the ancestors' handlers when the buffer fills, on
+    ERROR, or on detach(). Their messages are rendered as they are buffered,
+    so arguments referring to mutable state show the state at logging time.
+    """
+    
+    def __init__(self, logger: logging.Logger):
+        super().__init__(capacity=8192, flushLevel=logging.ERROR, target=_ParentLoggerHandler(logger))
+        self.logger = logger
+        self.previous_propagate = logger.propagate
+        logger.addHandler(self)
+        logger.propagate = False
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            record.msg = record.getMessage()
+            record.args = None
+        except Exception:
+            self.handleError(record)
+            return
+        super().emit(record)
+    
+    def detach(self) -> None:
+        """Flush the buffer and give the logger back its plain propagation"""
+        self.logger.removeHandler(self)
+        self.logger.propagate = self.previous_propagate
+        self.close()
+
+
+def _buffer_scenario_logger(logger: logging.Logger) -> Optional[_ScenarioLogBuffer]:
+    """Buffer a scenario logger for one run if SEADOG_LOG_BUFFERED is set
+    
+    Buffered records reach the output out of order with the unbuffered agent
+    loggers, so this is opt-in for runs where logging volume matters. None is
+    returned when buffering is off or another run already buffers the logger.
+    """
+    if not os.getenv("SEADOG_LOG_BUFFERED"):
+        return None
+    
+    # Scenario loggers are shared by name, only the first concurrent run installs a buffer
+    if any(isinstance(handler, _ScenarioLogBuffer) for handler in logger.handlers):
+        return None
+    
+    return _ScenarioLogBuffer(logger)
+
+
+class _AgentMissionTimeout(Exception):
+    """An agent mission exceeded the scenario's per-agent timeout"""
+    
+    def __init__(self, timeout: float):
+        super().__init__(f"Agent mission exceeded {timeout} seconds")
+        self.timeout = timeout
+
+
+class _MetricsAccumulator:
+    """Running performance metrics over agent results, fed one result at a time
+    
+    Counts, total, min and max are updated in place so no list of results or
+    execution times has to be kept.
+    """
+    
+    __slots__ = ("total_agents", "successful_agents", "total_time", "max_time", "min_time")
+    
+    def __init__(self):
+        self.total_agents = 0
+        self.successful_agents = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.min_time: Optional[float] = None
+    
+    def add(self, result: Dict[str, Any]) -> None:
+        self.total_agents += 1
+        if result.get("status") == _STATUS_COMPLETED:
+            self.successful_agents += 1
+        
+        exec_time = result.get("execution_time", 0)
+        self.total_time += exec_time
+        if exec_time > self.max_time:
+            self.max_time = exec_time
+        if self.min_time is None or exec_time < self.min_time:
+            self.min_time = exec_time
+    
+    @classmethod
+    def from_columns(cls, statuses: List[str],
+                     exec_times: Union["array[float]", np.ndarray]) -> "_MetricsAccumulator":
+        """Build the running totals from column data in one C-level call per figure
+        
+        Large populations are reduced with NumPy; an array('d') is viewed
+        without copying.
+        """
+        accumulator = cls()
+        accumulator.total_agents = len(statuses)
+        accumulator.successful_agents = statuses.count(_STATUS_COMPLETED)
+        if len(exec_times) >= _NUMPY_MIN_AGENTS:
+            times = exec_times if isinstance(exec_times, np.ndarray) else np.frombuffer(exec_times, dtype=np.float64)
+            accumulator.total_time = float(times.sum())
+            accumulator.max_time = max(0.0, float(times.max()))
+            accumulator.min_time = float(times.min())
+        elif len(exec_times):
+            accumulator.total_time = sum(exec_times)
+            accumulator.max_time = max(0.0, max(exec_times))
+            accumulator.min_time = min(exec_times)
+        return accumulator
+    
+    def metrics(self) -> Dict[str, Any]:
+        total_agents = self.total_agents
+        metrics = {
+            "total_agents": total_agents,
+            "successful_agents": self.successful_agents,
+            "failed_agents": total_agents - self.successful_agents,
+            "total_execution_time": self.total_time,
+            "average_execution_time": 0.0,
+            "max_execution_time": self.max_time,
+            "min_execution_time": self.min_time or 0.0,
+            "throughput": 0.0,  # agents per minute
+            "success_rate": 0.0
+        }
+        
+        # Calculate derived metrics
+        if total_agents > 0:
+            average_time = self.total_time / total_agents
+            metrics["average_execution_time"] = average_time
+            if average_time > 0:
+                metrics["throughput"] = 60 / average_time  # agents per minute
+            
+            metrics["success_rate"] = self.successful_agents / total_agents
+        
+        return metrics
 
 
 class ScenarioType(Enum):
@@ -38,7 +214,7 @@ class ScenarioStatus(Enum):
     ABORTED = "ABORTED"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ScenarioObjective:
     """Scenario objective definition"""
     objective_id: str
@@ -50,7 +226,7 @@ class ScenarioObjective:
     estimated_duration: int  # minutes
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ScenarioResult:
     """Scenario execution result"""
     scenario_id: str
@@ -70,6 +246,13 @@ class ScenarioResult:
 class BaseScenario(ABC):
     """Base class for all test scenarios"""
     
+    # Static part of the scenario metadata; created_at is added per instance
+    _METADATA_DEFAULTS = {
+        "scenario_version": "1.0.0",
+        "framework_version": "SEADOG-1.0.0",
+        "risk_assessment": "MODERATE"
+    }
+    
     def __init__(self, scenario_id: str, scenario_type: ScenarioType):
         self.scenario_id = scenario_id
         self.scenario_type = scenario_type
@@ -86,20 +269,37 @@ class BaseScenario(ABC):
         # Execution tracking
         self.execution_start: Optional[datetime] = None
         self.execution_end: Optional[datetime] = None
+        self._execution_start_ns = 0
         self.results: Optional[ScenarioResult] = None
         self.agent_reports: List[Dict[str, Any]] = []
+        # Column view of agent_reports (status, execution_time) for metrics
+        self._status_col: List[str] = []
+        self._exec_time_col: "array[float]" = array("d")
         self.performance_metrics: Dict[str, Any] = {}
         
-        # Scenario metadata
-        self.metadata = {
-            "created_at": datetime.now().isoformat(),
-            "scenario_version": "1.0.0",
-            "framework_version": "SEADOG-1.0.0",
-            "compliance_standards": [],
-            "risk_assessment": "MODERATE"
-        }
+        # Scenario metadata, built on first access from the creation timestamp
+        self._created_at = time.time()
+        self._metadata: Optional[Dict[str, Any]] = None
         
-        self.logger.info(f"Base scenario {scenario_id} initialized")
+        self.logger.info("Base scenario %s initialized", scenario_id)
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Scenario metadata; the created_at timestamp is only formatted when read"""
+        if self._metadata is None:
+            defaults = self._METADATA_DEFAULTS
+            self._metadata = {
+                "created_at": datetime.fromtimestamp(self._created_at).isoformat(),
+                "scenario_version": defaults["scenario_version"],
+                "framework_version": defaults["framework_version"],
+                "compliance_standards": [],
+                "risk_assessment": defaults["risk_assessment"]
+            }
+        return self._metadata
+    
+    @metadata.setter
+    def metadata(self, value: Dict[str, Any]) -> None:
+        self._metadata = value
     
     @abstractmethod
     async def setup_scenario(self) -> bool:
@@ -124,40 +324,61 @@ class BaseScenario(ABC):
     def add_objective(self, objective: ScenarioObjective):
         """Add objective to scenario"""
         self.objectives.append(objective)
-        self.logger.info(f"Objective added: {objective.objective_id}")
+        self.logger.info("Objective added: %s", objective.objective_id)
+    
+    def add_objectives(self, objectives: Iterable[ScenarioObjective]):
+        """Add several objectives to scenario with a single extend and log line"""
+        count = len(self.objectives)
+        self.objectives.extend(objectives)
+        self.logger.info("Objectives added: %s", len(self.objectives) - count)
     
     def add_agent(self, agent: BaseAgent):
         """Add agent to scenario"""
         self.participating_agents.append(agent)
-        self.logger.info(f"Agent added: {agent.call_sign} ({agent.agent_id})")
+        self.logger.info("Agent added: %s (%s)", agent.call_sign, agent.agent_id)
+    
+    def add_agents(self, agents: Iterable[BaseAgent]):
+        """Add several agents to scenario with a single extend and log line"""
+        count = len(self.participating_agents)
+        self.participating_agents.extend(agents)
+        self.logger.info("Agents added: %s", len(self.participating_agents) - count)
     
     def add_target_url(self, url: str):
         """Add target URL to scenario"""
         self.target_urls.append(url)
-        self.logger.info(f"Target URL added: {url}")
+        self.logger.info("Target URL added: %s", url)
+    
+    def add_target_urls(self, urls: Iterable[str]):
+        """Add several target URLs to scenario with a single extend and log line"""
+        count = len(self.target_urls)
+        self.target_urls.extend(urls)
+        self.logger.info("Target URLs added: %s", len(self.target_urls) - count)
     
     def set_parameter(self, key: str, value: Any):
         """Set scenario parameter"""
         self.scenario_parameters[key] = value
-        self.logger.info(f"Parameter set: {key} = {value}")
+        self.logger.info("Parameter set: %s = %s", key, value)
     
     def add_validation_protocol(self, protocol: Dict[str, Any]):
         """Add validation protocol"""
         self.validation_protocols.append(protocol)
-        self.logger.info(f"Validation protocol added: {protocol.get('protocol_id', 'UNKNOWN')}")
+        self.logger.info("Validation protocol added: %s", protocol.get('protocol_id', 'UNKNOWN'))
     
     async def run_scenario(self) -> ScenarioResult:
         """Run complete scenario lifecycle"""
         
-        self.logger.info(f"Starting scenario {self.scenario_id}")
+        log_buffer = _buffer_scenario_logger(self.logger)
+        self.logger.info("Starting scenario %s", self.scenario_id)
         self.status = ScenarioStatus.EXECUTING
         self.execution_start = datetime.now()
+        self._execution_start_ns = time.monotonic_ns()
         
         try:
             # Setup phase
             setup_success = await self.setup_scenario()
             if not setup_success:
                 self.status = ScenarioStatus.FAILED
+                self._mark_execution_end()
                 self.logger.error("Scenario setup failed")
                 return self._create_failure_result("Setup failed")
             
@@ -175,105 +396,202 @@ class BaseScenario(ABC):
             if not cleanup_success:
                 self.logger.warning("Scenario cleanup encountered issues")
             
-            self.execution_end = datetime.now()
+            result.duration = self._mark_execution_end()
             result.end_time = self.execution_end
-            result.duration = self.execution_end - self.execution_start
             
             self.status = ScenarioStatus.COMPLETED
             self.results = result
             
-            self.logger.info(f"Scenario {self.scenario_id} completed successfully")
+            self.logger.info("Scenario %s completed successfully", self.scenario_id)
             return result
             
         except Exception as e:
-            self.logger.error(f"Scenario execution failed: {str(e)}")
+            self.logger.error("Scenario execution failed: %s", str(e))
             self.status = ScenarioStatus.FAILED
-            self.execution_end = datetime.now()
+            self._mark_execution_end()
             
             # Attempt cleanup even on failure
             try:
                 await self.cleanup_scenario()
             except Exception as cleanup_error:
-                self.logger.error(f"Cleanup failed: {str(cleanup_error)}")
+                self.logger.error("Cleanup failed: %s", str(cleanup_error))
             
             return self._create_failure_result(str(e))
+        
+        finally:
+            if log_buffer is not None:
+                log_buffer.detach()
+    
+    def _mark_execution_end(self) -> timedelta:
+        """Record the end of execution and return the elapsed time
+        
+        The duration is measured on the monotonic clock so wall-clock jumps
+        do not distort it; execution_end is derived from it instead of
+        reading the wall clock a second time.
+        """
+        duration = timedelta(microseconds=(time.monotonic_ns() - self._execution_start_ns) / 1000)
+        self.execution_end = self.execution_start + duration
+        return duration
     
     def _create_failure_result(self, error_message: str) -> ScenarioResult:
         """Create failure result"""
+        # The wall clock is only read when the run never recorded its own times
+        now = datetime.now() if self.execution_start is None or self.execution_end is None else None
         return ScenarioResult(
             scenario_id=self.scenario_id,
             status=ScenarioStatus.FAILED,
-            start_time=self.execution_start or datetime.now(),
-            end_time=datetime.now(),
+            start_time=self.execution_start or now,
+            end_time=self.execution_end or now,
             duration=None,
             objectives_met=[],
-            objectives_failed=[obj.objective_id for obj in self.objectives],
+            objectives_failed=list(map(attrgetter("objective_id"), self.objectives)),
             performance_metrics={},
             agent_reports=[],
             validation_results={"error": error_message},
-            recommendations=[f"Investigate failure: {error_message}"],
+            recommendations=["Investigate failure: " + error_message],
             artifacts=[]
         )
     
     async def execute_agents(self) -> List[Dict[str, Any]]:
         """Execute all participating agents"""
         
-        self.logger.info(f"Executing {len(self.participating_agents)} agents")
-        agent_results = []
-        
-        # Execute agents concurrently
-        tasks = []
-        for agent in self.participating_agents:
-            task = self._execute_agent_mission(agent)
-            tasks.append(task)
+        agents = self.participating_agents
+        timeout = self.scenario_parameters.get("agent_timeout", 300)
+        mission_params = self._build_mission_params()
+        self.logger.info("Executing %s agents", len(agents))
+        
+        # Execute agents concurrently; one agent failing must not cancel the others
+        loop = asyncio.get_running_loop()
+        if _EAGER_TASK_START:
+            tasks = [
+                asyncio.Task(self._execute_agent_mission(agent, timeout, mission_params), loop=loop, eager_start=True)
+                for agent in agents
+            ]
+        else:
+            tasks = [loop.create_task(self._execute_agent_mission(agent, timeout, mission_params))
+                     for agent in agents]
         
         # Wait for all agents to complete
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
-        # Process results
-        for i, result in enumerate(results):
-            agent = self.participating_agents[i]
-            
-            if isinstance(result, Exception):
-                self.logger.error(f"Agent {agent.call_sign} failed: {str(result)}")
-                agent_result = {
-                    "agent_id": agent.agent_id,
-                    "call_sign": agent.call_sign,
-                    "squad": agent.squad,
-                    "status": "FAILED",
-                    "error": str(result),
-                    "execution_time": 0
-                }
-            else:
-                agent_result = {
-                    "agent_id": agent.agent_id,
-                    "call_sign": agent.call_sign,
-                    "squad": agent.squad,
-                    "status": "COMPLETED",
-                    "result": result,
-                    "execution_time": result.get("execution_time", 0)
-                }
-            
-            agent_results.append(agent_result)
+        # Process results, paired with the agents in launch order
+        agent_results = [self._agent_result(agent, result) for agent, result in zip(agents, results)]
         
         self.agent_reports = agent_results
+        self._status_col = [agent_result["status"] for agent_result in agent_results]
+        self._exec_time_col = array("d", [agent_result["execution_time"] for agent_result in agent_results])
         return agent_results
     
-    async def _execute_agent_mission(self, agent: BaseAgent) -> Dict[str, Any]:
-        """Execute individual agent mission"""
-        
-        start_time = time.time()
+    def _agent_result(self, agent: BaseAgent, result: Any) -> Dict[str, Any]:
+        """Build the report entry of one agent from its mission result or exception"""
+        agent_result = {
+            "agent_id": agent.agent_id,
+            "call_sign": agent.call_sign,
+            "squad": agent.squad
+        }
         
-        # Prepare mission parameters
-        mission_params = {
+        if isinstance(result, _AgentMissionTimeout):
+            self.logger.error("Agent %s timed out after %s seconds", agent.call_sign, result.timeout)
+            agent_result["status"] = _STATUS_TIMEOUT
+            agent_result["error"] = str(result)
+            agent_result["execution_time"] = result.timeout
+        elif isinstance(result, Exception):
+            error = str(result)
+            self.logger.error("Agent %s failed: %s", agent.call_sign, error)
+            agent_result["status"] = _STATUS_FAILED
+            agent_result["error"] = error
+            agent_result["execution_time"] = 0
+        else:
+            agent_result["status"] = _STATUS_COMPLETED
+            agent_result["result"] = result
+            agent_result["execution_time"] = result.get("execution_time", 0)
+        
+        return agent_result
+    
+    async def stream_agent_results(self, queue_size: int = 64) -> AsyncIterator[Dict[str, Any]]:
+        """Execute all participating agents, yielding report entries as they finish
+        
+        Entries pass through a queue of at most queue_size items and are not
+        collected, so consumers can start processing while missions still run.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        producer = asyncio.get_running_loop().create_task(self._agent_producer(queue))
+        try:
+            while True:
+                agent_result = await queue.get()
+                if agent_result is None:
+                    return
+                yield agent_result
+        finally:
+            producer.cancel()
+    
+    async def execute_agents_streaming(self, queue_size: int = 64) -> Dict[str, Any]:
+        """Execute all participating agents and return their performance metrics
+        
+        Metrics are folded in as reports stream in; unlike execute_agents the
+        individual reports are not kept in agent_reports.
+        """
+        accumulator = _MetricsAccumulator()
+        async for agent_result in self.stream_agent_results(queue_size):
+            accumulator.add(agent_result)
+        return accumulator.metrics()
+    
+    async def _agent_producer(self, queue: asyncio.Queue) -> None:
+        """Put agent report entries on queue in completion order, then a None sentinel"""
+        timeout = self.scenario_parameters.get("agent_timeout", 300)
+        loop = asyncio.get_running_loop()
+        mission_params = self._build_mission_params()
+        tasks = [
+            loop.create_task(self._run_agent(agent, timeout, mission_params))
+            for agent in self.participating_agents
+        ]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                await queue.put(await next_result)
+        finally:
+            for task in tasks:
+                task.cancel()
+        await queue.put(None)
+    
+    async def _run_agent(self, agent: BaseAgent, timeout: Optional[float],
+                         mission_params: Mapping[str, Any]) -> Dict[str, Any]:
+        """Execute one agent mission and build its report entry"""
+        try:
+            result = await self._execute_agent_mission(agent, timeout, mission_params)
+        except Exception as e:
+            result = e
+        return self._agent_result(agent, result)
+    
+    def _build_mission_params(self) -> Mapping[str, Any]:
+        """Mission parameters shared read-only by every agent of one run"""
+        return MappingProxyType({
             "scenario_id": self.scenario_id,
-            "target_urls": self.target_urls,
+            "target_urls": tuple(self.target_urls),
             "scenario_parameters": self.scenario_parameters,
-            "objectives": [obj.objective_id for obj in self.objectives]
-        }
+            "objectives": tuple(obj.objective_id for obj in self.objectives)
+        })
+    
+    async def _execute_agent_mission(self, agent: BaseAgent, timeout: Optional[float] = None,
+                                     mission_params: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+        """Execute individual agent mission, bounded by timeout seconds if given"""
+        
+        start_time = time.time()
+        
+        # Prepare mission parameters, unless the caller built them for the whole run
+        if mission_params is None:
+            mission_params = self._build_mission_params()
         
-        # Execute agent mission
-        result = await agent.execute_mission(mission_params)
+        # Execute agent mission; a straggler is reported instead of stalling the scenario
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        try:
+            result = await asyncio.wait_for(agent.execute_mission(mission_params), timeout=timeout)
+        except asyncio.TimeoutError:
+            # From 3.11 on this is the builtin TimeoutError, which the agent itself may raise;
+            # only a passed deadline is ours, anything else is an ordinary agent failure
+            if deadline is None or loop.time() < deadline:
+                raise
+            raise _AgentMissionTimeout(timeout) from None
         
         execution_time = time.time() - start_time
         result["execution_time"] = execution_time
@@ -283,84 +601,75 @@ class BaseScenario(ABC):
     def calculate_performance_metrics(self, agent_results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate performance metrics from agent results"""
         
-        metrics = {
-            "total_agents": len(agent_results),
-            "successful_agents": 0,
-            "failed_agents": 0,
-            "total_execution_time": 0.0,
-            "average_execution_time": 0.0,
-            "max_execution_time": 0.0,
-            "min_execution_time": float('inf'),
-            "throughput": 0.0,  # agents per minute
-            "success_rate": 0.0
-        }
+        # The reports of the last execute_agents run have a column view ready
+        if agent_results is self.agent_reports and len(self._status_col) == len(agent_results):
+            return _MetricsAccumulator.from_columns(self._status_col, self._exec_time_col).metrics()
         
-        execution_times = []
+        count = len(agent_results)
+        if count >= _NUMPY_MIN_AGENTS:
+            statuses = [result.get("status") for result in agent_results]
+            exec_times = np.fromiter(
+                (result.get("execution_time", 0) for result in agent_results), dtype=np.float64, count=count
+            )
+            return _MetricsAccumulator.from_columns(statuses, exec_times).metrics()
         
+        accumulator = _MetricsAccumulator()
+        add = accumulator.add
         for result in agent_results:
-            if result.get("status") == "COMPLETED":
-                metrics["successful_agents"] += 1
-            else:
-                metrics["failed_agents"] += 1
-            
-            exec_time = result.get("execution_time", 0)
-            execution_times.append(exec_time)
-            metrics["total_execution_time"] += exec_time
-            
-            if exec_time > metrics["max_execution_time"]:
-                metrics["max_execution_time"] = exec_time
-            if exec_time < metrics["min_execution_time"]:
-                metrics["min_execution_time"] = exec_time
-        
-        # Calculate derived metrics
-        if execution_times:
-            metrics["average_execution_time"] = sum(execution_times) / len(execution_times)
-            metrics["min_execution_time"] = min(execution_times)
-            
-            if metrics["average_execution_time"] > 0:
-                metrics["throughput"] = 60 / metrics["average_execution_time"]  # agents per minute
-        
-        if metrics["total_agents"] > 0:
-            metrics["success_rate"] = metrics["successful_agents"] / metrics["total_agents"]
-        
-        return metrics
+            add(result)
+        return accumulator.metrics()
     
     def evaluate_objectives(self, agent_results: List[Dict[str, Any]]) -> Tuple[List[str], List[str]]:
         """Evaluate scenario objectives"""
         
         objectives_met = []
         objectives_failed = []
+        metrics = self.calculate_performance_metrics(agent_results)
         
         for objective in self.objectives:
-            if self._evaluate_objective(objective, agent_results):
+            if self._evaluate_objective(objective, agent_results, metrics):
                 objectives_met.append(objective.objective_id)
             else:
                 objectives_failed.append(objective.objective_id)
         
         return objectives_met, objectives_failed
     
-    def _evaluate_objective(self, objective: ScenarioObjective, agent_results: List[Dict[str, Any]]) -> bool:
-        """Evaluate individual objective"""
+    async def evaluate_objectives_async(self, agent_results: List[Dict[str, Any]]) -> Tuple[List[str], List[str]]:
+        """Evaluate scenario objectives concurrently
         
-        success_criteria = objective.success_criteria
+        For scenarios whose validation methods call out to external validators
+        (by overriding _evaluate_objective_async); otherwise this falls back
+        to the synchronous evaluate_objectives without scheduling any tasks.
+        """
+        if type(self)._evaluate_objective_async is BaseScenario._evaluate_objective_async:
+            return self.evaluate_objectives(agent_results)
         
-        # Basic success criteria evaluation
-        if "min_success_rate" in success_criteria:
-            min_success_rate = success_criteria["min_success_rate"]
-            metrics = self.calculate_performance_metrics(agent_results)
-            if metrics["success_rate"] < min_success_rate:
-                return False
+        objectives = self.objectives
+        metrics = self.calculate_performance_metrics(agent_results)
+        outcomes = await asyncio.gather(*[
+            self._evaluate_objective_async(objective, agent_results, metrics) for objective in objectives
+        ])
+        
+        objectives_met = [objective.objective_id for objective, met in zip(objectives, outcomes) if met]
+        objectives_failed = [objective.objective_id for objective, met in zip(objectives, outcomes) if not met]
+        return objectives_met, objectives_failed
+    
+    async def _evaluate_objective_async(self, objective: ScenarioObjective, agent_results: List[Dict[str, Any]],
+                                        metrics: Dict[str, Any]) -> bool:
+        """Evaluate individual objective; override to await I/O-bound validation"""
+        return self._evaluate_objective(objective, agent_results, metrics)
+    
+    def _evaluate_objective(self, objective: ScenarioObjective, agent_results: List[Dict[str, Any]],
+                            metrics: Optional[Dict[str, Any]] = None) -> bool:
+        """Evaluate individual objective"""
         
-        if "max_execution_time" in success_criteria:
-            max_exec_time = success_criteria["max_execution_time"]
+        if metrics is None:
             metrics = self.calculate_performance_metrics(agent_results)
-            if metrics["average_execution_time"] > max_exec_time:
-                return False
         
-        if "required_agents" in success_criteria:
-            required_agents = success_criteria["required_agents"]
-            successful_agents = sum(1 for r in agent_results if r.get("status") == "COMPLETED")
-            if successful_agents < required_agents:
+        # Basic success criteria evaluation
+        for criterion, value in objective.success_criteria.items():
+            evaluator = _CRITERIA_EVALUATORS.get(criterion)
+            if evaluator is not None and not evaluator(metrics, value, agent_results):
                 return False
         
         return True
@@ -375,20 +684,20 @@ class BaseScenario(ABC):
         metrics = self.calculate_performance_metrics(agent_results)
         
         if metrics["success_rate"] < 0.9:
-            recommendations.append("IMPROVE_AGENT_RELIABILITY")
+            recommendations.append(_REC_IMPROVE_RELIABILITY)
         
         if metrics["average_execution_time"] > 30:
-            recommendations.append("OPTIMIZE_AGENT_PERFORMANCE")
+            recommendations.append(_REC_OPTIMIZE_PERFORMANCE)
         
         if metrics["failed_agents"] > 0:
-            recommendations.append("INVESTIGATE_AGENT_FAILURES")
+            recommendations.append(_REC_INVESTIGATE_FAILURES)
         
         # Validation-based recommendations
         if validation_results.get("validation_errors"):
-            recommendations.append("ADDRESS_VALIDATION_ISSUES")
+            recommendations.append(_REC_ADDRESS_VALIDATION)
         
         if validation_results.get("compliance_issues"):
-            recommendations.append("IMPROVE_COMPLIANCE_ADHERENCE")
+            recommendations.append(_REC_IMPROVE_COMPLIANCE)
         
         return recommendations
     
@@ -408,18 +717,23 @@ class BaseScenario(ABC):
             "framework_version": self.metadata["framework_version"]
         }
     
-    def export_results(self, format: str = "json") -> str:
-        """Export scenario results"""
+    def export_results(self, format: str = "json", pretty: bool = True) -> str:
+        """Export scenario results
+        
+        Pass pretty=False for compact output when the export is consumed by
+        another program rather than read by a person.
+        """
         
         if not self.results:
-            return json.dumps({"error": "No results available"})
+            return dumps_json({"error": "No results available"}, indent=False)
         
         if format.lower() == "json":
-            return json.dumps({
+            # datetime/timedelta values are stringified by the encoder's default hook
+            return dumps_json({
                 "scenario_summary": self.get_scenario_summary(),
                 "results": {
                     "status": self.results.status.value,
-                    "duration": str(self.results.duration) if self.results.duration else None,
+                    "duration": self.results.duration,
                     "objectives_met": self.results.objectives_met,
                     "objectives_failed": self.results.objectives_failed,
                     "performance_metrics": self.results.performance_metrics,
@@ -428,6 +742,6 @@ class BaseScenario(ABC):
                 },
                 "agent_reports": self.agent_reports,
                 "metadata": self.metadata
-            }, indent=2)
+            }, indent=pretty, default=str)
         
-        return "Unsupported format"
\ No newline at end of file
+        return "Unsupported format"
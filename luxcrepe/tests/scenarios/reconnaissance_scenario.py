@@ -3,20 +3,177 @@ Reconnaissance Scenario - SEADOG Military Testing Framework
 Comprehensive reconnaissance and intelligence gathering operations
 """
 
+import sys
+import copy
 import asyncio
-import logging
-from typing import Dict, Any, List
-from datetime import datetime, timedelta
+from array import array
+from typing import Dict, Any, List, Optional, Tuple, Iterator, Mapping
+from dataclasses import dataclass, field
+from statistics import fmean
+from types import MappingProxyType
 
-from .base_scenario import BaseScenario, ScenarioType, ScenarioStatus, ScenarioObjective, ScenarioResult
-from ..base_agent import ReportPriority
+import numpy as np
+
+from .base_scenario import (
+    BaseScenario, ScenarioType, ScenarioStatus, ScenarioObjective, ScenarioResult,
+    _EAGER_TASK_START, _NUMPY_MIN_AGENTS, _STATUS_COMPLETED
+)
+from ..base_agent import ReportPriority, DATACLASS_SLOTS
 from ..agents.alpha import ReconSpecialistAgent, SurveillanceSpecialistAgent
 from ..agents.delta import IntelAnalystAgent
 
 
+# Reconnaissance metric names, interned once at import
+_METRIC_KEYS: Tuple[str, ...] = tuple(map(sys.intern, (
+    "reconnaissance_coverage",
+    "target_discovery_rate",
+    "intelligence_gathering_efficiency",
+    "surveillance_effectiveness",
+    "operational_stealth",
+    "data_collection_volume",
+    "threat_assessment_accuracy"
+)))
+
+# Placeholder stealth assessment, high stealth assumed for reconnaissance
+_OPERATIONAL_STEALTH = 0.85
+
+# Shared stand-in for a missing agent result, saves allocating a dict per report
+_NO_RESULT = MappingProxyType({})
+
+# Sentinel for an absent agent result section
+_MISSING = object()
+
+# (section, field) paths into agent results read by the fused scan
+_PATH_DISCOVERIES = ("target_discovery", "successful_discoveries")
+_PATH_COVERAGE = ("target_discovery", "coverage_percentage")
+_PATH_INTEL_CONFIDENCE = ("intelligence_summary", "intelligence_confidence")
+_PATH_SURVEILLANCE_DURATION = ("surveillance_data", "monitoring_duration")
+_PATH_SURVEILLANCE_EFFECTIVENESS = ("surveillance_data", "monitoring_effectiveness")
+
+
+def _deep_get(mapping: Mapping[str, Any], path: Tuple[str, ...], default: Any = 0) -> Any:
+    """Follow path through nested agent result mappings
+    
+    Returns _MISSING when an enclosing section is absent and default when only
+    the final field is, mirroring the "section present, field optional" schema.
+    """
+    for key in path[:-1]:
+        mapping = mapping.get(key, _MISSING)
+        if mapping is _MISSING:
+            return _MISSING
+    return mapping.get(path[-1], default)
+
+
+def _column_max(values: "array[float]") -> float:
+    """Largest value of a score column, never below 0.0"""
+    if len(values) >= _NUMPY_MIN_AGENTS:
+        return float(np.frombuffer(values, dtype=np.float64).max(initial=0.0))
+    return max(max(values), 0.0) if values else 0.0
+
+
+@dataclass(**DATACLASS_SLOTS)
+class _ReconScan:
+    """Aggregates of one pass over agent results, shared by metrics, recommendations and validators"""
+    successful: int = 0
+    discoveries: int = 0
+    intel_reports: int = 0
+    surveillance_duration: float = 0
+    max_coverage: float = 0.0
+    max_intel_confidence: float = 0.0
+    max_surveillance_effectiveness: float = 0.0
+    intel_confidences: "array[float]" = field(default_factory=lambda: array("d"))
+    surveillance_effectiveness: "array[float]" = field(default_factory=lambda: array("d"))
+
+
+# Prototypes of the default reconnaissance objectives, copied into every scenario
+_DEFAULT_OBJECTIVES: Tuple[ScenarioObjective, ...] = (
+    ScenarioObjective(
+        objective_id="RECON_OBJ_001",
+        objective_type="TARGET_DISCOVERY",
+        description="Discover and catalog all accessible targets",
+        success_criteria={
+            "min_targets_discovered": 5,
+            "target_response_rate": 0.8,
+            "discovery_completeness": 0.85
+        },
+        validation_method="AUTOMATED_VERIFICATION",
+        priority=ReportPriority.PRIORITY,
+        estimated_duration=15
+    ),
+    ScenarioObjective(
+        objective_id="RECON_OBJ_002",
+        objective_type="INFRASTRUCTURE_MAPPING",
+        description="Map target infrastructure and technology stack",
+        success_criteria={
+            "infrastructure_components_identified": 10,
+            "technology_fingerprint_accuracy": 0.9,
+            "network_topology_completeness": 0.8
+        },
+        validation_method="EXPERT_REVIEW",
+        priority=ReportPriority.PRIORITY,
+        estimated_duration=20
+    ),
+    ScenarioObjective(
+        objective_id="RECON_OBJ_003",
+        objective_type="INTELLIGENCE_GATHERING",
+        description="Gather operational intelligence on targets",
+        success_criteria={
+            "intelligence_reports_generated": 3,
+            "intelligence_confidence_threshold": 0.7,
+            "threat_assessment_coverage": 0.85
+        },
+        validation_method="INTELLIGENCE_ANALYSIS",
+        priority=ReportPriority.ROUTINE,
+        estimated_duration=25
+    ),
+    ScenarioObjective(
+        objective_id="RECON_OBJ_004",
+        objective_type="SURVEILLANCE_MONITORING",
+        description="Conduct continuous surveillance and monitoring",
+        success_criteria={
+            "surveillance_duration": 300,  # 5 minutes
+            "monitoring_coverage": 0.95,
+            "anomaly_detection_rate": 0.8
+        },
+        validation_method="BEHAVIORAL_ANALYSIS",
+        priority=ReportPriority.ROUTINE,
+        estimated_duration=30
+    )
+)
+
+
 class ReconnaissanceScenario(BaseScenario):
     """Reconnaissance scenario for intelligence gathering operations"""
     
+    _RECON_ARTIFACTS: Tuple[str, ...] = (
+        # Target discovery artifacts
+        "target_discovery_report.json",
+        "infrastructure_map.json",
+        "technology_fingerprints.json",
+        # Intelligence artifacts
+        "intelligence_assessment.json",
+        "threat_landscape_analysis.json",
+        "vulnerability_summary.json",
+        # Surveillance artifacts
+        "surveillance_timeline.json",
+        "behavioral_patterns.json",
+        "anomaly_detection_log.json",
+        # Operational artifacts
+        "reconnaissance_timeline.json",
+        "operational_security_log.json",
+        "performance_metrics.json"
+    )
+    
+    _RECOMMENDATION_TABLE: Tuple[str, ...] = (
+        "IMPROVE_AGENT_COORDINATION",
+        "EXPAND_TARGET_RECONNAISSANCE",
+        "ENHANCE_INTELLIGENCE_COLLECTION",
+        "IMPROVE_SURVEILLANCE_TECHNIQUES"
+    )
+    
+    # Reconnaissance metrics of a run without a single completed agent
+    _ZERO_METRICS: Dict[str, Any] = dict(zip(_METRIC_KEYS, (0.0, 0.0, 0.0, 0.0, _OPERATIONAL_STEALTH, 0, 0.0)))
+    
     def __init__(self, scenario_id: str = "RECON_OPS_001"):
         super().__init__(scenario_id, ScenarioType.RECONNAISSANCE)
         
@@ -26,71 +183,25 @@ class ReconnaissanceScenario(BaseScenario):
         self.reconnaissance_depth = "COMPREHENSIVE"
         self.operational_security_level = "COVERT"
         
+        # (agent_results, len at scan time, scan) of the last fused scan
+        self._last_scan: Optional[Tuple[List[Dict[str, Any]], int, _ReconScan]] = None
+        
         # Initialize default objectives
         self._initialize_default_objectives()
         
-        self.logger.info(f"Reconnaissance scenario {scenario_id} initialized")
+        self.logger.info("Reconnaissance scenario %s initialized", scenario_id)
     
     def _initialize_default_objectives(self):
         """Initialize default reconnaissance objectives"""
         
-        objectives = [
-            ScenarioObjective(
-                objective_id="RECON_OBJ_001",
-                objective_type="TARGET_DISCOVERY",
-                description="Discover and catalog all accessible targets",
-                success_criteria={
-                    "min_targets_discovered": 5,
-                    "target_response_rate": 0.8,
-                    "discovery_completeness": 0.85
-                },
-                validation_method="AUTOMATED_VERIFICATION",
-                priority=ReportPriority.HIGH,
-                estimated_duration=15
-            ),
-            ScenarioObjective(
-                objective_id="RECON_OBJ_002",
-                objective_type="INFRASTRUCTURE_MAPPING",
-                description="Map target infrastructure and technology stack",
-                success_criteria={
-                    "infrastructure_components_identified": 10,
-                    "technology_fingerprint_accuracy": 0.9,
-                    "network_topology_completeness": 0.8
-                },
-                validation_method="EXPERT_REVIEW",
-                priority=ReportPriority.HIGH,
-                estimated_duration=20
-            ),
-            ScenarioObjective(
-                objective_id="RECON_OBJ_003",
-                objective_type="INTELLIGENCE_GATHERING",
-                description="Gather operational intelligence on targets",
-                success_criteria={
-                    "intelligence_reports_generated": 3,
-                    "intelligence_confidence_threshold": 0.7,
-                    "threat_assessment_coverage": 0.85
-                },
-                validation_method="INTELLIGENCE_ANALYSIS",
-                priority=ReportPriority.MEDIUM,
-                estimated_duration=25
-            ),
-            ScenarioObjective(
-                objective_id="RECON_OBJ_004",
-                objective_type="SURVEILLANCE_MONITORING",
-                description="Conduct continuous surveillance and monitoring",
-                success_criteria={
-                    "surveillance_duration": 300,  # 5 minutes
-                    "monitoring_coverage": 0.95,
-                    "anomaly_detection_rate": 0.8
-                },
-                validation_method="BEHAVIORAL_ANALYSIS",
-                priority=ReportPriority.MEDIUM,
-                estimated_duration=30
-            )
-        ]
-        
-        for objective in objectives:
-            self.add_objective(objective)
+        objectives = []
+        for prototype in _DEFAULT_OBJECTIVES:
+            objective = copy.copy(prototype)
+            # Success criteria are mutable, scenarios must never share them
+            objective.success_criteria = dict(prototype.success_criteria)
+            objectives.append(objective)
+        
+        self.add_objectives(objectives)
     
     async def setup_scenario(self) -> bool:
         """Setup reconnaissance scenario"""
@@ -104,9 +215,7 @@ class ReconnaissanceScenario(BaseScenario):
             intel_agent = IntelAnalystAgent()
             
             # Add agents to scenario
-            self.add_agent(recon_agent)
-            self.add_agent(surveillance_agent)
-            self.add_agent(intel_agent)
+            self.add_agents((recon_agent, surveillance_agent, intel_agent))
             
             # Set scenario parameters
             self.set_parameter("reconnaissance_depth", self.reconnaissance_depth)
@@ -139,7 +248,7 @@ class ReconnaissanceScenario(BaseScenario):
             return True
             
         except Exception as e:
-            self.logger.error(f"Reconnaissance scenario setup failed: {str(e)}")
+            self.logger.error("Reconnaissance scenario setup failed: %s", str(e))
             self.status = ScenarioStatus.FAILED
             return False
     
@@ -155,19 +264,18 @@ class ReconnaissanceScenario(BaseScenario):
         performance_metrics = self.calculate_performance_metrics(agent_results)
         
         # Add reconnaissance-specific metrics
-        reconnaissance_metrics = await self._calculate_reconnaissance_metrics(agent_results)
+        reconnaissance_metrics = self._calculate_reconnaissance_metrics(agent_results)
         performance_metrics.update(reconnaissance_metrics)
         
         # Evaluate objectives
-        objectives_met, objectives_failed = self.evaluate_objectives(agent_results)
+        objectives_met, objectives_failed = await self.evaluate_objectives_async(agent_results)
         
         # Generate recommendations
         validation_results = {}  # Will be populated during validation
         recommendations = self.generate_recommendations(agent_results, validation_results)
         
         # Add reconnaissance-specific recommendations
-        recon_recommendations = self._generate_reconnaissance_recommendations(agent_results)
-        recommendations.extend(recon_recommendations)
+        self._generate_reconnaissance_recommendations(agent_results, recommendations)
         
         # Create scenario result
         result = ScenarioResult(
@@ -182,143 +290,129 @@ class ReconnaissanceScenario(BaseScenario):
             agent_reports=agent_results,
             validation_results={},  # Will be populated during validation
             recommendations=recommendations,
-            artifacts=self._generate_reconnaissance_artifacts(agent_results)
+            # Materialized here: the result is read and serialized more than once
+            artifacts=list(self._generate_reconnaissance_artifacts(agent_results))
         )
         
         self.logger.info("Reconnaissance scenario execution completed")
         return result
     
-    async def _calculate_reconnaissance_metrics(self, agent_results: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Calculate reconnaissance-specific metrics"""
+    @staticmethod
+    def _completed(agent_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Agent results of completed missions"""
+        return [result for result in agent_results if result.get("status") == _STATUS_COMPLETED]
+    
+    def _get_scan(self) -> _ReconScan:
+        """Fused scan of self.agent_reports, shared with the metrics computed during execution"""
+        return self._scan_agent_results(self.agent_reports)
+    
+    def _scan_agent_results(self, agent_results: List[Dict[str, Any]]) -> _ReconScan:
+        """Collect every reconnaissance aggregate in a single pass over agent results
         
-        metrics = {
-            "reconnaissance_coverage": 0.0,
-            "target_discovery_rate": 0.0,
-            "intelligence_gathering_efficiency": 0.0,
-            "surveillance_effectiveness": 0.0,
-            "operational_stealth": 0.0,
-            "data_collection_volume": 0,
-            "threat_assessment_accuracy": 0.0
-        }
+        The scan of the last (unchanged) agent_results list is reused.
+        """
+        cached = self._last_scan
+        if cached is not None and cached[0] is agent_results and cached[1] == len(agent_results):
+            return cached[2]
         
-        total_targets = len(self.target_urls)
-        successful_discoveries = 0
-        intelligence_reports = 0
+        discoveries = intel_reports = 0
         surveillance_duration = 0
+        coverages = array("d")
+        intel_confidences = array("d")
+        surveillance_effectiveness = array("d")
         
-        for result in agent_results:
-            if result.get("status") == "COMPLETED":
-                agent_result = result.get("result", {})
-                
-                # Target discovery metrics
-                if "target_discovery" in agent_result:
-                    discovery_data = agent_result["target_discovery"]
-                    successful_discoveries += discovery_data.get("successful_discoveries", 0)
-                
-                # Intelligence gathering metrics
-                if "intelligence_reports" in agent_result:
-                    intelligence_reports += len(agent_result["intelligence_reports"])
-                
-                # Surveillance metrics
-                if "surveillance_data" in agent_result:
-                    surveillance_data = agent_result["surveillance_data"]
-                    surveillance_duration += surveillance_data.get("monitoring_duration", 0)
-        
-        # Calculate derived metrics
-        if total_targets > 0:
-            metrics["target_discovery_rate"] = successful_discoveries / total_targets
-            metrics["reconnaissance_coverage"] = min(successful_discoveries / total_targets, 1.0)
-        
-        if intelligence_reports > 0:
-            metrics["intelligence_gathering_efficiency"] = intelligence_reports / len(self.participating_agents)
-        
-        if surveillance_duration > 0:
-            metrics["surveillance_effectiveness"] = min(surveillance_duration / 300, 1.0)  # 5 minutes target
-        
-        # Operational stealth assessment (placeholder)
-        metrics["operational_stealth"] = 0.85  # High stealth assumed for reconnaissance
-        
-        return metrics
-    
-    def _generate_reconnaissance_recommendations(self, agent_results: List[Dict[str, Any]]) -> List[str]:
-        """Generate reconnaissance-specific recommendations"""
-        
-        recommendations = []
-        
-        # Analyze agent performance
-        successful_agents = sum(1 for r in agent_results if r.get("status") == "COMPLETED")
-        total_agents = len(agent_results)
-        
-        if successful_agents < total_agents:
-            recommendations.append("IMPROVE_AGENT_COORDINATION")
-        
-        # Analyze target coverage
-        target_coverage = 0.0
-        for result in agent_results:
-            if result.get("status") == "COMPLETED":
-                agent_result = result.get("result", {})
-                if "target_discovery" in agent_result:
-                    discovery_data = agent_result["target_discovery"]
-                    coverage = discovery_data.get("coverage_percentage", 0)
-                    target_coverage = max(target_coverage, coverage)
-        
-        if target_coverage < 0.8:
-            recommendations.append("EXPAND_TARGET_RECONNAISSANCE")
-        
-        # Intelligence quality assessment
-        intelligence_quality = 0.0
-        for result in agent_results:
-            if result.get("status") == "COMPLETED":
-                agent_result = result.get("result", {})
-                if "intelligence_summary" in agent_result:
-                    intel_summary = agent_result["intelligence_summary"]
-                    quality = intel_summary.get("intelligence_confidence", 0)
-                    intelligence_quality = max(intelligence_quality, quality)
-        
-        if intelligence_quality < 0.7:
-            recommendations.append("ENHANCE_INTELLIGENCE_COLLECTION")
-        
-        # Surveillance effectiveness
-        surveillance_effectiveness = 0.0
-        for result in agent_results:
-            if result.get("status") == "COMPLETED":
-                agent_result = result.get("result", {})
-                if "surveillance_data" in agent_result:
-                    surveillance_data = agent_result["surveillance_data"]
-                    effectiveness = surveillance_data.get("monitoring_effectiveness", 0)
-                    surveillance_effectiveness = max(surveillance_effectiveness, effectiveness)
-        
-        if surveillance_effectiveness < 0.8:
-            recommendations.append("IMPROVE_SURVEILLANCE_TECHNIQUES")
-        
-        return recommendations
+        completed = self._completed(agent_results)
+        for result in completed:
+            agent_result = result.get("result", _NO_RESULT)
+            
+            # Target discovery metrics
+            value = _deep_get(agent_result, _PATH_DISCOVERIES)
+            if value is not _MISSING:
+                discoveries += value
+                coverages.append(_deep_get(agent_result, _PATH_COVERAGE))
+            
+            # Intelligence gathering metrics
+            if "intelligence_reports" in agent_result:
+                intel_reports += len(agent_result["intelligence_reports"])
+            
+            value = _deep_get(agent_result, _PATH_INTEL_CONFIDENCE)
+            if value is not _MISSING:
+                intel_confidences.append(value)
+            
+            # Surveillance metrics
+            value = _deep_get(agent_result, _PATH_SURVEILLANCE_DURATION)
+            if value is not _MISSING:
+                surveillance_duration += value
+                surveillance_effectiveness.append(_deep_get(agent_result, _PATH_SURVEILLANCE_EFFECTIVENESS))
+        
+        scan = _ReconScan(
+            successful=len(completed),
+            discoveries=discoveries,
+            intel_reports=intel_reports,
+            surveillance_duration=surveillance_duration,
+            max_coverage=_column_max(coverages),
+            max_intel_confidence=_column_max(intel_confidences),
+            max_surveillance_effectiveness=_column_max(surveillance_effectiveness),
+            intel_confidences=intel_confidences,
+            surveillance_effectiveness=surveillance_effectiveness
+        )
+        self._last_scan = (agent_results, len(agent_results), scan)
+        return scan
     
-    def _generate_reconnaissance_artifacts(self, agent_results: List[Dict[str, Any]]) -> List[str]:
-        """Generate reconnaissance artifacts"""
-        
-        artifacts = []
+    def _calculate_reconnaissance_metrics(self, agent_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Calculate reconnaissance-specific metrics"""
         
-        # Target discovery artifacts
-        artifacts.append("target_discovery_report.json")
-        artifacts.append("infrastructure_map.json")
-        artifacts.append("technology_fingerprints.json")
+        # Nothing to aggregate when every agent failed, common under chaos testing
+        if not any(result.get("status") == _STATUS_COMPLETED for result in agent_results):
+            return dict(self._ZERO_METRICS)
         
-        # Intelligence artifacts
-        artifacts.append("intelligence_assessment.json")
-        artifacts.append("threat_landscape_analysis.json")
-        artifacts.append("vulnerability_summary.json")
+        n_targets = len(self.target_urls)
+        n_agents = len(self.participating_agents)
+        scan = self._scan_agent_results(agent_results)
         
-        # Surveillance artifacts
-        artifacts.append("surveillance_timeline.json")
-        artifacts.append("behavioral_patterns.json")
-        artifacts.append("anomaly_detection_log.json")
+        # Calculate derived metrics
+        discovery_rate = scan.discoveries / n_targets if n_targets else 0.0
+        
+        # Values in _METRIC_KEYS order, built in one go rather than mutating a dict of defaults
+        return dict(zip(_METRIC_KEYS, (
+            min(discovery_rate, 1.0),
+            discovery_rate,
+            scan.intel_reports / n_agents if n_agents else 0.0,
+            min(scan.surveillance_duration / 300, 1.0),  # 5 minutes target
+            _OPERATIONAL_STEALTH,
+            0,  # data collection volume
+            0.0  # threat assessment accuracy
+        )))
+    
+    def _generate_reconnaissance_recommendations(self, agent_results: List[Dict[str, Any]],
+                                                 out: Optional[List[str]] = None) -> List[str]:
+        """Generate reconnaissance-specific recommendations
+        
+        Recommendations are appended to out when given, which is also returned.
+        """
+        
+        scan = self._scan_agent_results(agent_results)
+        
+        # One bit per _RECOMMENDATION_TABLE entry: agent performance, target coverage,
+        # intelligence quality, surveillance effectiveness
+        flags = (
+            (scan.successful < len(agent_results))
+            | (scan.max_coverage < 0.8) << 1
+            | (scan.max_intel_confidence < 0.7) << 2
+            | (scan.max_surveillance_effectiveness < 0.8) << 3
+        )
         
-        # Operational artifacts
-        artifacts.append("reconnaissance_timeline.json")
-        artifacts.append("operational_security_log.json")
-        artifacts.append("performance_metrics.json")
+        if out is None:
+            out = []
+        for bit, recommendation in enumerate(self._RECOMMENDATION_TABLE):
+            if flags >> bit & 1:
+                out.append(recommendation)
+        return out
+    
+    def _generate_reconnaissance_artifacts(self, agent_results: List[Dict[str, Any]]) -> Iterator[str]:
+        """Generate reconnaissance artifacts, lazily"""
         
-        return artifacts
+        yield from self._RECON_ARTIFACTS
     
     async def validate_results(self) -> Dict[str, Any]:
         """Validate reconnaissance results"""
@@ -334,31 +428,46 @@ class ReconnaissanceScenario(BaseScenario):
             "validation_details": {}
         }
         
-        # Validate target discovery
-        target_validation = await self._validate_target_discovery()
-        validation_results["validation_details"]["target_discovery"] = target_validation
-        
-        # Validate intelligence quality
-        intelligence_validation = await self._validate_intelligence_quality()
-        validation_results["validation_details"]["intelligence_quality"] = intelligence_validation
-        
-        # Validate surveillance effectiveness
-        surveillance_validation = await self._validate_surveillance_effectiveness()
-        validation_results["validation_details"]["surveillance_effectiveness"] = surveillance_validation
-        
-        # Validate operational security
-        opsec_validation = await self._validate_operational_security()
-        validation_results["validation_details"]["operational_security"] = opsec_validation
+        # The async validators are independent, run them concurrently
+        async_validators = (
+            ("target_discovery", "TARGET_DISCOVERY_VALIDATION", self._validate_target_discovery),
+            ("intelligence_quality", "INTELLIGENCE_QUALITY_VALIDATION", self._validate_intelligence_quality),
+            ("surveillance_effectiveness", "SURVEILLANCE_EFFECTIVENESS_VALIDATION",
+             self._validate_surveillance_effectiveness)
+        )
+        if _EAGER_TASK_START:
+            loop = asyncio.get_running_loop()
+            pending = [asyncio.Task(validator(), loop=loop, eager_start=True) for _, _, validator in async_validators]
+        else:
+            pending = [validator() for _, _, validator in async_validators]
+        outcomes = await asyncio.gather(*pending, return_exceptions=True)
+        
+        validators = async_validators + (
+            ("operational_security", "OPERATIONAL_SECURITY_VALIDATION", self._validate_operational_security),
+        )
+        try:
+            outcomes.append(self._validate_operational_security())
+        except Exception as e:
+            outcomes.append(e)
+        
+        quality_scores = []
+        for (detail_key, validation_type, _), validation in zip(validators, outcomes):
+            if isinstance(validation, BaseException):
+                if not isinstance(validation, Exception):
+                    raise validation
+                self.logger.error("%s failed: %s", validation_type, str(validation))
+                validation = {
+                    "validation_type": validation_type,
+                    "quality_score": 0.0,
+                    "issues": ["VALIDATION_ERROR"],
+                    "recommendations": [],
+                    "error": str(validation)
+                }
+            validation_results["validation_details"][detail_key] = validation
+            quality_scores.append(validation.get("quality_score", 0))
         
         # Calculate overall quality score
-        quality_scores = [
-            target_validation.get("quality_score", 0),
-            intelligence_validation.get("quality_score", 0),
-            surveillance_validation.get("quality_score", 0),
-            opsec_validation.get("quality_score", 0)
-        ]
-        
-        validation_results["quality_score"] = sum(quality_scores) / len(quality_scores)
+        validation_results["quality_score"] = fmean(quality_scores)
         
         # Determine overall validation status
         if validation_results["quality_score"] < 0.6:
@@ -366,7 +475,7 @@ class ReconnaissanceScenario(BaseScenario):
         elif validation_results["quality_score"] < 0.8:
             validation_results["validation_status"] = "PASSED_WITH_WARNINGS"
         
-        self.logger.info(f"Reconnaissance validation completed: {validation_results['validation_status']}")
+        self.logger.info("Reconnaissance validation completed: %s", validation_results['validation_status'])
         return validation_results
     
     async def _validate_target_discovery(self) -> Dict[str, Any]:
@@ -380,15 +489,9 @@ class ReconnaissanceScenario(BaseScenario):
         }
         
         # Check target discovery completeness
-        discovered_targets = 0
-        for result in self.agent_reports:
-            if result.get("status") == "COMPLETED":
-                agent_result = result.get("result", {})
-                if "target_discovery" in agent_result:
-                    discovery_data = agent_result["target_discovery"]
-                    discovered_targets += discovery_data.get("successful_discoveries", 0)
-        
-        discovery_rate = discovered_targets / len(self.target_urls) if self.target_urls else 0
+        discovered_targets = self._get_scan().discoveries
+        n_targets = len(self.target_urls)
+        discovery_rate = discovered_targets / n_targets if n_targets else 0
         
         if discovery_rate < 0.8:
             validation["issues"].append("LOW_TARGET_DISCOVERY_RATE")
@@ -408,20 +511,10 @@ class ReconnaissanceScenario(BaseScenario):
         }
         
         # Check intelligence confidence levels
-        intelligence_confidence = 0.0
-        intelligence_count = 0
-        
-        for result in self.agent_reports:
-            if result.get("status") == "COMPLETED":
-                agent_result = result.get("result", {})
-                if "intelligence_summary" in agent_result:
-                    intel_summary = agent_result["intelligence_summary"]
-                    confidence = intel_summary.get("intelligence_confidence", 0)
-                    intelligence_confidence += confidence
-                    intelligence_count += 1
-        
-        if intelligence_count > 0:
-            avg_confidence = intelligence_confidence / intelligence_count
+        confidences = self._get_scan().intel_confidences
+        
+        if confidences:
+            avg_confidence = sum(confidences) / len(confidences)
             validation["quality_score"] = avg_confidence
             
             if avg_confidence < 0.7:
@@ -441,20 +534,10 @@ class ReconnaissanceScenario(BaseScenario):
         }
         
         # Check surveillance coverage and duration
-        surveillance_effectiveness = 0.0
-        surveillance_count = 0
-        
-        for result in self.agent_reports:
-            if result.get("status") == "COMPLETED":
-                agent_result = result.get("result", {})
-                if "surveillance_data" in agent_result:
-                    surveillance_data = agent_result["surveillance_data"]
-                    effectiveness = surveillance_data.get("monitoring_effectiveness", 0)
-                    surveillance_effectiveness += effectiveness
-                    surveillance_count += 1
-        
-        if surveillance_count > 0:
-            avg_effectiveness = surveillance_effectiveness / surveillance_count
+        effectiveness = self._get_scan().surveillance_effectiveness
+        
+        if effectiveness:
+            avg_effectiveness = sum(effectiveness) / len(effectiveness)
             validation["quality_score"] = avg_effectiveness
             
             if avg_effectiveness < 0.8:
@@ -463,7 +546,7 @@ class ReconnaissanceScenario(BaseScenario):
         
         return validation
     
-    async def _validate_operational_security(self) -> Dict[str, Any]:
+    def _validate_operational_security(self) -> Dict[str, Any]:
         """Validate operational security"""
         
         validation = {
@@ -485,6 +568,7 @@ class ReconnaissanceScenario(BaseScenario):
         
         try:
             # Cleanup reconnaissance-specific resources
+            self._last_scan = None
             # Clear temporary intelligence data
             # Reset agent states
             # Clean up surveillance monitoring
@@ -493,25 +577,25 @@ class ReconnaissanceScenario(BaseScenario):
             return True
             
         except Exception as e:
-            self.logger.error(f"Reconnaissance scenario cleanup failed: {str(e)}")
+            self.logger.error("Reconnaissance scenario cleanup failed: %s", str(e))
             return False
     
     def add_intelligence_requirement(self, requirement: Dict[str, Any]):
         """Add intelligence requirement to scenario"""
         self.intelligence_requirements.append(requirement)
-        self.logger.info(f"Intelligence requirement added: {requirement.get('requirement_id', 'UNKNOWN')}")
+        self.logger.info("Intelligence requirement added: %s", requirement.get('requirement_id', 'UNKNOWN'))
     
     def set_reconnaissance_depth(self, depth: str):
         """Set reconnaissance depth level"""
         self.reconnaissance_depth = depth
         self.set_parameter("reconnaissance_depth", depth)
-        self.logger.info(f"Reconnaissance depth set to: {depth}")
+        self.logger.info("Reconnaissance depth set to: %s", depth)
     
     def set_operational_security_level(self, level: str):
         """Set operational security level"""
         self.operational_security_level = level
         self.set_parameter("operational_security", level)
-        self.logger.info(f"Operational security level set to: {level}")
+        self.logger.info("Operational security level set to: %s", level)
     
     def get_reconnaissance_summary(self) -> Dict[str, Any]:
         """Get reconnaissance scenario summary"""
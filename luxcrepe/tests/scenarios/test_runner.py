@@ -5,16 +5,42 @@ Comprehensive test orchestration and execution system
 
 import asyncio
 import logging
-import json
 import time
 import os
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Callable, Awaitable, Mapping
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 
 from .base_scenario import BaseScenario, ScenarioResult, ScenarioStatus
+from ..base_agent import DATACLASS_SLOTS
 from .reconnaissance_scenario import ReconnaissanceScenario
+from ...core.utils import dumps_json
+
+# Timestamp format of execution ids and report filenames
+_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+_FRAMEWORK_VERSION = "SEADOG-1.0.0"
+
+# Overall metrics before any scenario result has been accumulated, copied per run
+_EMPTY_METRICS_TEMPLATE: Mapping[str, Any] = MappingProxyType({
+    "total_scenarios": 0,
+    "successful_scenarios": 0,
+    "failed_scenarios": 0,
+    "total_execution_time": 0.0,
+    "average_scenario_time": 0.0,
+    "success_rate": 0.0,
+    "overall_score": 0.0
+})
+
+
+class _ScenarioTimeout(Exception):
+    """A scenario exceeded the configured per-scenario timeout"""
+    
+    def __init__(self, timeout: float):
+        super().__init__(f"Scenario exceeded {timeout} seconds")
+        self.timeout = timeout
 
 
 class TestSuite(Enum):
@@ -29,7 +55,7 @@ class TestSuite(Enum):
     FULL_SPECTRUM = "FULL_SPECTRUM"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TestConfiguration:
     """Test configuration settings"""
     suite_type: TestSuite
@@ -39,6 +65,8 @@ class TestConfiguration:
     parallel_execution: bool
     report_format: str
     output_directory: str
+    max_concurrent_scenarios: int = 5  # in-flight scenarios during parallel execution
+    per_scenario_timeout_seconds: Optional[int] = None  # no per-scenario limit when unset
 
 
 class SEADOGTestRunner:
@@ -48,37 +76,63 @@ class SEADOGTestRunner:
         self.config = config
         self.logger = logging.getLogger("SEADOG.TestRunner")
         
+        # Suite naming, resolved once from the configuration
+        self._suite_type_value = config.suite_type.value
+        self._filename_stem = f"seadog_test_report_{self._suite_type_value.lower()}"
+        
         # Test execution tracking
-        self.test_execution_id = f"SEADOG_TEST_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.test_execution_id = f"SEADOG_TEST_{datetime.now().strftime(_TIMESTAMP_FORMAT)}"
         self.scenarios: List[BaseScenario] = []
         self.test_results: List[ScenarioResult] = []
         self.execution_start: Optional[datetime] = None
         self.execution_end: Optional[datetime] = None
         
-        # Test metrics
-        self.overall_metrics = {
-            "total_scenarios": 0,
-            "successful_scenarios": 0,
-            "failed_scenarios": 0,
-            "total_execution_time": 0.0,
-            "average_scenario_time": 0.0,
-            "success_rate": 0.0,
-            "overall_score": 0.0
+        # Formatted execution times, cached when the timestamps are recorded
+        self._exec_start_iso: Optional[str] = None
+        self._exec_end_iso: Optional[str] = None
+        self._total_duration_str: Optional[str] = None
+        
+        # Scenario initializer per suite type
+        self._suite_dispatch: Dict[TestSuite, Callable[[], Awaitable[None]]] = {
+            TestSuite.RECONNAISSANCE: self._initialize_reconnaissance_scenarios,
+            TestSuite.PENETRATION_TESTING: self._initialize_penetration_scenarios,
+            TestSuite.STRESS_TESTING: self._initialize_stress_scenarios,
+            TestSuite.PERFORMANCE_TESTING: self._initialize_performance_scenarios,
+            TestSuite.COMPLIANCE_TESTING: self._initialize_compliance_scenarios,
+            TestSuite.INTEGRATION_TESTING: self._initialize_integration_scenarios,
+            TestSuite.OPERATIONAL_TESTING: self._initialize_operational_scenarios,
+            TestSuite.FULL_SPECTRUM: self._initialize_full_spectrum_scenarios
         }
         
-        self.logger.info(f"SEADOG Test Runner initialized - Execution ID: {self.test_execution_id}")
+        # Report entries of scenario results, keyed by result identity
+        self._scenario_reports: Dict[int, Tuple[ScenarioResult, Dict[str, Any]]] = {}
+        
+        # Test metrics
+        self.overall_metrics: Dict[str, Any] = {}
+        self._quality_score_total = 0.0
+        self._quality_score_count = 0
+        self._agent_failures = 0
+        self._reset_overall_metrics()
+        
+        self.logger.info("SEADOG Test Runner initialized - Execution ID: %s", self.test_execution_id)
     
     async def run_test_suite(self) -> Dict[str, Any]:
         """Run complete test suite"""
         
-        self.logger.info(f"Starting SEADOG test suite: {self.config.suite_type.value}")
+        self.logger.info("Starting SEADOG test suite: %s", self._suite_type_value)
         self.execution_start = datetime.now()
+        self._exec_start_iso = self.execution_start.isoformat()
+        self.execution_end = None
+        self._exec_end_iso = None
+        self._total_duration_str = None
         
         try:
             # Initialize test scenarios
             await self._initialize_test_scenarios()
             
-            # Execute test scenarios
+            # Execute test scenarios, results are folded into the metrics as they arrive
+            self._reset_overall_metrics()
+            self._scenario_reports.clear()
             if self.config.parallel_execution:
                 test_results = await self._execute_scenarios_parallel()
             else:
@@ -87,7 +141,7 @@ class SEADOGTestRunner:
             self.test_results = test_results
             
             # Calculate overall metrics
-            self._calculate_overall_metrics()
+            self._finalize_overall_metrics()
             
             # Generate test report
             test_report = await self._generate_test_report()
@@ -95,53 +149,48 @@ class SEADOGTestRunner:
             # Save test results
             await self._save_test_results(test_report)
             
-            self.execution_end = datetime.now()
+            self._mark_execution_end()
             
-            self.logger.info(f"SEADOG test suite completed: {len(test_results)} scenarios executed")
+            self.logger.info("SEADOG test suite completed: %s scenarios executed", len(test_results))
             return test_report
             
         except Exception as e:
-            self.logger.error(f"Test suite execution failed: {str(e)}")
-            self.execution_end = datetime.now()
+            self.logger.error("Test suite execution failed: %s", str(e))
+            self._mark_execution_end()
             
             return {
                 "execution_id": self.test_execution_id,
                 "status": "FAILED",
                 "error": str(e),
-                "execution_time": str(self.execution_end - self.execution_start) if self.execution_start else None
+                "execution_time": self._total_duration_str
             }
     
+    def _mark_execution_end(self):
+        """Record the end of execution and cache its formatted times"""
+        
+        self.execution_end = datetime.now()
+        self._exec_end_iso = self.execution_end.isoformat()
+        self._total_duration_str = str(self.execution_end - self.execution_start)
+    
     async def _initialize_test_scenarios(self):
         """Initialize test scenarios based on suite type"""
         
-        self.logger.info(f"Initializing scenarios for suite: {self.config.suite_type.value}")
-        
-        if self.config.suite_type == TestSuite.RECONNAISSANCE:
-            await self._initialize_reconnaissance_scenarios()
-        elif self.config.suite_type == TestSuite.PENETRATION_TESTING:
-            await self._initialize_penetration_scenarios()
-        elif self.config.suite_type == TestSuite.STRESS_TESTING:
-            await self._initialize_stress_scenarios()
-        elif self.config.suite_type == TestSuite.PERFORMANCE_TESTING:
-            await self._initialize_performance_scenarios()
-        elif self.config.suite_type == TestSuite.COMPLIANCE_TESTING:
-            await self._initialize_compliance_scenarios()
-        elif self.config.suite_type == TestSuite.INTEGRATION_TESTING:
-            await self._initialize_integration_scenarios()
-        elif self.config.suite_type == TestSuite.OPERATIONAL_TESTING:
-            await self._initialize_operational_scenarios()
-        elif self.config.suite_type == TestSuite.FULL_SPECTRUM:
-            await self._initialize_full_spectrum_scenarios()
-        
-        self.logger.info(f"Initialized {len(self.scenarios)} test scenarios")
+        self.logger.info("Initializing scenarios for suite: %s", self._suite_type_value)
+        
+        initializer = self._suite_dispatch.get(self.config.suite_type)
+        if initializer is None:
+            self.logger.warning("No scenario initializer for suite: %s", self.config.suite_type)
+        else:
+            await initializer()
+        
+        self.logger.info("Initialized %s test scenarios", len(self.scenarios))
     
     async def _initialize_reconnaissance_scenarios(self):
         """Initialize reconnaissance test scenarios"""
         
         # Basic reconnaissance scenario
         recon_scenario = ReconnaissanceScenario("RECON_BASIC_001")
-        for url in self.config.target_urls:
-            recon_scenario.add_target_url(url)
+        recon_scenario.add_target_urls(self.config.target_urls)
         
         # Set reconnaissance parameters
         recon_params = self.config.test_parameters.get("reconnaissance", {})
@@ -155,8 +204,7 @@ class SEADOGTestRunner:
         intel_scenario.set_reconnaissance_depth("DEEP_ANALYSIS")
         intel_scenario.set_operational_security_level("DEEP_COVER")
         
-        for url in self.config.target_urls:
-            intel_scenario.add_target_url(url)
+        intel_scenario.add_target_urls(self.config.target_urls)
         
         # Add intelligence requirements
         intel_scenario.add_intelligence_requirement({
@@ -201,63 +249,65 @@ class SEADOGTestRunner:
     async def _initialize_full_spectrum_scenarios(self):
         """Initialize full spectrum testing scenarios"""
         
-        # Include all scenario types
-        await self._initialize_reconnaissance_scenarios()
-        await self._initialize_penetration_scenarios()
-        await self._initialize_stress_scenarios()
-        await self._initialize_performance_scenarios()
-        await self._initialize_compliance_scenarios()
-        await self._initialize_integration_scenarios()
-        await self._initialize_operational_scenarios()
+        # Include all scenario types, the initializers are independent of each other
+        await asyncio.gather(
+            self._initialize_reconnaissance_scenarios(),
+            self._initialize_penetration_scenarios(),
+            self._initialize_stress_scenarios(),
+            self._initialize_performance_scenarios(),
+            self._initialize_compliance_scenarios(),
+            self._initialize_integration_scenarios(),
+            self._initialize_operational_scenarios()
+        )
     
     async def _execute_scenarios_parallel(self) -> List[ScenarioResult]:
         """Execute scenarios in parallel"""
         
-        self.logger.info(f"Executing {len(self.scenarios)} scenarios in parallel")
+        self.logger.info("Executing %s scenarios in parallel", len(self.scenarios))
+        
+        # Cap in-flight scenarios, each one fans out agent and network work of its own
+        semaphore = asyncio.Semaphore(max(1, self.config.max_concurrent_scenarios))
+        
+        async def run_bounded(index: int, scenario: BaseScenario) -> Tuple[int, ScenarioResult]:
+            async with semaphore:
+                try:
+                    return index, await self._execute_single_scenario(scenario)
+                except Exception as e:
+                    return index, self._create_scenario_error_result(scenario, e)
         
         # Create tasks for all scenarios
-        tasks = []
-        for scenario in self.scenarios:
-            task = asyncio.create_task(self._execute_single_scenario(scenario))
-            tasks.append(task)
+        tasks = [asyncio.create_task(run_bounded(index, scenario)) for index, scenario in enumerate(self.scenarios)]
         
-        # Execute all scenarios concurrently with timeout
+        # Fold results into the overall metrics as each scenario finishes, kept in scenario order
         timeout_seconds = self.config.execution_timeout * 60
+        scenario_results: List[Optional[ScenarioResult]] = [None] * len(tasks)
         
         try:
-            results = await asyncio.wait_for(
-                asyncio.gather(*tasks, return_exceptions=True),
-                timeout=timeout_seconds
-            )
-            
-            # Process results
-            scenario_results = []
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    self.logger.error(f"Scenario {self.scenarios[i].scenario_id} failed: {str(result)}")
-                    # Create failure result
-                    failure_result = self._create_scenario_failure_result(self.scenarios[i], str(result))
-                    scenario_results.append(failure_result)
-                else:
-                    scenario_results.append(result)
-            
-            return scenario_results
+            for next_done in asyncio.as_completed(tasks, timeout=timeout_seconds):
+                index, result = await next_done
+                scenario_results[index] = result
+                self._accumulate_metric(result)
             
         except asyncio.TimeoutError:
-            self.logger.error(f"Test execution timed out after {self.config.execution_timeout} minutes")
+            self.logger.error("Test execution timed out after %s minutes", self.config.execution_timeout)
             
-            # Create timeout results for all scenarios
-            timeout_results = []
-            for scenario in self.scenarios:
-                timeout_result = self._create_scenario_timeout_result(scenario)
-                timeout_results.append(timeout_result)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
             
-            return timeout_results
+            # Create timeout results for the scenarios that did not finish
+            for index, scenario in enumerate(self.scenarios):
+                if scenario_results[index] is None:
+                    timeout_result = self._create_scenario_timeout_result(scenario)
+                    scenario_results[index] = timeout_result
+                    self._accumulate_metric(timeout_result)
+        
+        return scenario_results
     
     async def _execute_scenarios_sequential(self) -> List[ScenarioResult]:
         """Execute scenarios sequentially"""
         
-        self.logger.info(f"Executing {len(self.scenarios)} scenarios sequentially")
+        self.logger.info("Executing %s scenarios sequentially", len(self.scenarios))
         
         scenario_results = []
         
@@ -265,43 +315,62 @@ class SEADOGTestRunner:
             try:
                 result = await self._execute_single_scenario(scenario)
                 scenario_results.append(result)
+                self._accumulate_metric(result)
                 
-                self.logger.info(f"Scenario {scenario.scenario_id} completed: {result.status.value}")
+                self.logger.info("Scenario %s completed: %s", scenario.scenario_id, result.status.value)
                 
             except Exception as e:
-                self.logger.error(f"Scenario {scenario.scenario_id} failed: {str(e)}")
-                failure_result = self._create_scenario_failure_result(scenario, str(e))
+                failure_result = self._create_scenario_error_result(scenario, e)
                 scenario_results.append(failure_result)
+                self._accumulate_metric(failure_result)
         
         return scenario_results
     
     async def _execute_single_scenario(self, scenario: BaseScenario) -> ScenarioResult:
         """Execute single scenario with monitoring"""
         
-        self.logger.info(f"Executing scenario: {scenario.scenario_id}")
+        self.logger.info("Executing scenario: %s", scenario.scenario_id)
         
-        start_time = time.time()
+        start_time = time.perf_counter()
+        timeout = self.config.per_scenario_timeout_seconds
         
         try:
-            result = await scenario.run_scenario()
-            execution_time = time.time() - start_time
+            if timeout:
+                try:
+                    result = await asyncio.wait_for(scenario.run_scenario(), timeout)
+                except asyncio.TimeoutError:
+                    raise _ScenarioTimeout(timeout) from None
+            else:
+                result = await scenario.run_scenario()
+            execution_time = time.perf_counter() - start_time
             
-            self.logger.info(f"Scenario {scenario.scenario_id} completed in {execution_time:.2f} seconds")
+            self.logger.info("Scenario %s completed in %.2f seconds", scenario.scenario_id, execution_time)
             return result
             
         except Exception as e:
-            execution_time = time.time() - start_time
-            self.logger.error(f"Scenario {scenario.scenario_id} failed after {execution_time:.2f} seconds: {str(e)}")
+            execution_time = time.perf_counter() - start_time
+            self.logger.error("Scenario %s failed after %.2f seconds: %s", scenario.scenario_id, execution_time, str(e))
             raise
     
+    def _create_scenario_error_result(self, scenario: BaseScenario, error: Exception) -> ScenarioResult:
+        """Create timeout or failure result for a scenario that raised"""
+        
+        if isinstance(error, _ScenarioTimeout):
+            self.logger.error("Scenario %s timed out after %s seconds", scenario.scenario_id, error.timeout)
+            return self._create_scenario_timeout_result(scenario, error.timeout)
+        
+        self.logger.error("Scenario %s failed: %s", scenario.scenario_id, str(error))
+        return self._create_scenario_failure_result(scenario, str(error))
+    
     def _create_scenario_failure_result(self, scenario: BaseScenario, error_message: str) -> ScenarioResult:
         """Create failure result for scenario"""
         
+        now = datetime.now()
         return ScenarioResult(
             scenario_id=scenario.scenario_id,
             status=ScenarioStatus.FAILED,
-            start_time=datetime.now(),
-            end_time=datetime.now(),
+            start_time=now,
+            end_time=now,
             duration=timedelta(seconds=0),
             objectives_met=[],
             objectives_failed=[obj.objective_id for obj in scenario.objectives],
@@ -312,15 +381,20 @@ class SEADOGTestRunner:
             artifacts=[]
         )
     
-    def _create_scenario_timeout_result(self, scenario: BaseScenario) -> ScenarioResult:
+    def _create_scenario_timeout_result(self, scenario: BaseScenario,
+                                        timeout_seconds: Optional[float] = None) -> ScenarioResult:
         """Create timeout result for scenario"""
         
+        now = datetime.now()
         return ScenarioResult(
             scenario_id=scenario.scenario_id,
             status=ScenarioStatus.ABORTED,
-            start_time=datetime.now(),
-            end_time=datetime.now(),
-            duration=timedelta(minutes=self.config.execution_timeout),
+            start_time=now,
+            end_time=now,
+            duration=(
+                timedelta(seconds=timeout_seconds) if timeout_seconds is not None
+                else timedelta(minutes=self.config.execution_timeout)
+            ),
             objectives_met=[],
             objectives_failed=[obj.objective_id for obj in scenario.objectives],
             performance_metrics={},
@@ -330,71 +404,94 @@ class SEADOGTestRunner:
             artifacts=[]
         )
     
-    def _calculate_overall_metrics(self):
-        """Calculate overall test metrics"""
+    def _reset_overall_metrics(self):
+        """Reset the running test metrics before an execution"""
         
-        self.overall_metrics["total_scenarios"] = len(self.test_results)
+        self.overall_metrics = dict(_EMPTY_METRICS_TEMPLATE)
+        self._quality_score_total = 0.0
+        self._quality_score_count = 0
+        self._agent_failures = 0
+    
+    def _accumulate_metric(self, result: ScenarioResult):
+        """Fold a single scenario result into the running test metrics"""
         
-        successful_count = 0
-        failed_count = 0
-        total_execution_time = 0.0
-        quality_scores = []
+        metrics = self.overall_metrics
+        metrics["total_scenarios"] += 1
         
-        for result in self.test_results:
-            if result.status == ScenarioStatus.COMPLETED:
-                successful_count += 1
-                
-                # Add quality score if available
-                validation_results = result.validation_results
-                if "quality_score" in validation_results:
-                    quality_scores.append(validation_results["quality_score"])
-                
-            else:
-                failed_count += 1
+        if result.status is ScenarioStatus.COMPLETED:
+            metrics["successful_scenarios"] += 1
+            
+            # Add quality score if available
+            validation_results = result.validation_results
+            if "quality_score" in validation_results:
+                self._quality_score_total += validation_results["quality_score"]
+                self._quality_score_count += 1
             
-            # Calculate execution time
-            if result.duration:
-                total_execution_time += result.duration.total_seconds()
+        else:
+            metrics["failed_scenarios"] += 1
+        
+        # Calculate execution time
+        if result.duration:
+            metrics["total_execution_time"] += result.duration.total_seconds()
+        
+        # Agent failures, read by the findings and recommendations
+        for agent_report in result.agent_reports:
+            if agent_report.get("status") != "COMPLETED":
+                self._agent_failures += 1
+    
+    def _finalize_overall_metrics(self):
+        """Derive rates and averages from the accumulated test metrics"""
         
-        self.overall_metrics["successful_scenarios"] = successful_count
-        self.overall_metrics["failed_scenarios"] = failed_count
-        self.overall_metrics["total_execution_time"] = total_execution_time
+        metrics = self.overall_metrics
+        total_scenarios = metrics["total_scenarios"]
         
-        # Calculate derived metrics
-        if self.overall_metrics["total_scenarios"] > 0:
-            self.overall_metrics["success_rate"] = successful_count / self.overall_metrics["total_scenarios"]
-            self.overall_metrics["average_scenario_time"] = total_execution_time / self.overall_metrics["total_scenarios"]
+        if total_scenarios > 0:
+            metrics["success_rate"] = metrics["successful_scenarios"] / total_scenarios
+            metrics["average_scenario_time"] = metrics["total_execution_time"] / total_scenarios
         
-        if quality_scores:
-            self.overall_metrics["overall_score"] = sum(quality_scores) / len(quality_scores)
+        if self._quality_score_count:
+            metrics["overall_score"] = self._quality_score_total / self._quality_score_count
+    
+    def _calculate_overall_metrics(self):
+        """Calculate overall test metrics from scratch"""
+        
+        self._reset_overall_metrics()
+        if not self.test_results:
+            # Aborted suites have nothing to aggregate, the reset metrics are final
+            return
+        
+        for result in self.test_results:
+            self._accumulate_metric(result)
+        self._finalize_overall_metrics()
     
     async def _generate_test_report(self) -> Dict[str, Any]:
         """Generate comprehensive test report"""
         
         self.logger.info("Generating test report")
         
+        config = self.config
         report = {
             "execution_metadata": {
                 "execution_id": self.test_execution_id,
-                "suite_type": self.config.suite_type.value,
-                "execution_start": self.execution_start.isoformat() if self.execution_start else None,
-                "execution_end": self.execution_end.isoformat() if self.execution_end else None,
-                "total_duration": str(self.execution_end - self.execution_start) if self.execution_end and self.execution_start else None,
-                "parallel_execution": self.config.parallel_execution,
-                "framework_version": "SEADOG-1.0.0"
+                "suite_type": self._suite_type_value,
+                "execution_start": self._exec_start_iso,
+                "execution_end": self._exec_end_iso,
+                "total_duration": self._total_duration_str,
+                "parallel_execution": config.parallel_execution,
+                "framework_version": _FRAMEWORK_VERSION
             },
             
             "test_configuration": {
-                "target_urls": self.config.target_urls,
-                "test_parameters": self.config.test_parameters,
-                "execution_timeout": self.config.execution_timeout,
-                "report_format": self.config.report_format,
-                "output_directory": self.config.output_directory
+                "target_urls": config.target_urls,
+                "test_parameters": config.test_parameters,
+                "execution_timeout": config.execution_timeout,
+                "report_format": config.report_format,
+                "output_directory": config.output_directory
             },
             
             "overall_metrics": self.overall_metrics,
             
-            "scenario_results": [],
+            "scenario_results": [self._result_to_dict(result) for result in self.test_results],
             
             "summary": {
                 "test_status": "PASSED" if self.overall_metrics["success_rate"] >= 0.8 else "FAILED",
@@ -404,28 +501,39 @@ class SEADOGTestRunner:
             }
         }
         
-        # Add detailed scenario results
-        for result in self.test_results:
-            scenario_report = {
-                "scenario_id": result.scenario_id,
-                "status": result.status.value,
-                "duration": str(result.duration) if result.duration else None,
-                "objectives_met": result.objectives_met,
-                "objectives_failed": result.objectives_failed,
-                "performance_metrics": result.performance_metrics,
-                "validation_results": result.validation_results,
-                "recommendations": result.recommendations,
-                "artifacts": result.artifacts
-            }
-            report["scenario_results"].append(scenario_report)
-        
         return report
     
+    def _result_to_dict(self, result: ScenarioResult) -> Dict[str, Any]:
+        """Report entry for a scenario result, built once per result
+        
+        Results are final once a scenario has run, so the entry is cached and
+        reused by later report generations.
+        """
+        cached = self._scenario_reports.get(id(result))
+        if cached is not None and cached[0] is result:
+            return cached[1]
+        
+        scenario_report = {
+            "scenario_id": result.scenario_id,
+            "status": result.status.value,
+            "duration": str(result.duration) if result.duration else None,
+            "objectives_met": result.objectives_met,
+            "objectives_failed": result.objectives_failed,
+            "performance_metrics": result.performance_metrics,
+            "validation_results": result.validation_results,
+            "recommendations": result.recommendations,
+            "artifacts": result.artifacts
+        }
+        # The result is kept alongside its entry so the id cannot be reused while cached
+        self._scenario_reports[id(result)] = (result, scenario_report)
+        return scenario_report
+    
     def _assess_overall_quality(self) -> str:
         """Assess overall test quality"""
         
-        overall_score = self.overall_metrics.get("overall_score", 0.0)
-        success_rate = self.overall_metrics.get("success_rate", 0.0)
+        metrics = self.overall_metrics
+        overall_score = metrics.get("overall_score", 0.0)
+        success_rate = metrics.get("success_rate", 0.0)
         
         # Weighted quality assessment
         quality_score = (overall_score * 0.7) + (success_rate * 0.3)
@@ -445,26 +553,27 @@ class SEADOGTestRunner:
         """Extract key findings from test results"""
         
         findings = []
+        metrics = self.overall_metrics
         
         # Success rate findings
-        success_rate = self.overall_metrics.get("success_rate", 0.0)
+        success_rate = metrics.get("success_rate", 0.0)
         if success_rate < 0.8:
             findings.append(f"LOW_SUCCESS_RATE: {success_rate:.2%} of scenarios failed")
         
         # Performance findings
-        avg_time = self.overall_metrics.get("average_scenario_time", 0.0)
+        avg_time = metrics.get("average_scenario_time", 0.0)
         if avg_time > 300:  # 5 minutes
             findings.append(f"SLOW_EXECUTION: Average scenario time {avg_time:.1f} seconds")
         
         # Quality findings
-        overall_score = self.overall_metrics.get("overall_score", 0.0)
+        overall_score = metrics.get("overall_score", 0.0)
         if overall_score < 0.7:
             findings.append(f"LOW_QUALITY_SCORE: Overall quality score {overall_score:.2%}")
         
         # Scenario-specific findings
-        failed_scenarios = [r for r in self.test_results if r.status != ScenarioStatus.COMPLETED]
+        failed_scenarios = metrics.get("failed_scenarios", 0)
         if failed_scenarios:
-            findings.append(f"SCENARIO_FAILURES: {len(failed_scenarios)} scenarios failed")
+            findings.append(f"SCENARIO_FAILURES: {failed_scenarios} scenarios failed")
         
         return findings
     
@@ -472,19 +581,20 @@ class SEADOGTestRunner:
         """Generate overall recommendations"""
         
         recommendations = []
+        metrics = self.overall_metrics
         
         # Success rate recommendations
-        success_rate = self.overall_metrics.get("success_rate", 0.0)
+        success_rate = metrics.get("success_rate", 0.0)
         if success_rate < 0.9:
             recommendations.append("IMPROVE_SCENARIO_RELIABILITY")
         
         # Performance recommendations
-        avg_time = self.overall_metrics.get("average_scenario_time", 0.0)
+        avg_time = metrics.get("average_scenario_time", 0.0)
         if avg_time > 180:  # 3 minutes
             recommendations.append("OPTIMIZE_SCENARIO_EXECUTION")
         
         # Quality recommendations
-        overall_score = self.overall_metrics.get("overall_score", 0.0)
+        overall_score = metrics.get("overall_score", 0.0)
         if overall_score < 0.8:
             recommendations.append("ENHANCE_TEST_QUALITY")
         
@@ -493,13 +603,7 @@ class SEADOGTestRunner:
             recommendations.append("EXPAND_TEST_COVERAGE")
         
         # Agent performance recommendations
-        agent_failures = 0
-        for result in self.test_results:
-            for agent_report in result.agent_reports:
-                if agent_report.get("status") != "COMPLETED":
-                    agent_failures += 1
-        
-        if agent_failures > 0:
+        if self._agent_failures > 0:
             recommendations.append("IMPROVE_AGENT_PERFORMANCE")
         
         return recommendations
@@ -507,35 +611,57 @@ class SEADOGTestRunner:
     async def _save_test_results(self, test_report: Dict[str, Any]):
         """Save test results to file"""
         
-        # Ensure output directory exists
-        os.makedirs(self.config.output_directory, exist_ok=True)
-        
         # Generate filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"seadog_test_report_{self.config.suite_type.value.lower()}_{timestamp}.json"
+        timestamp = datetime.now().strftime(_TIMESTAMP_FORMAT)
+        filename = f"{self._filename_stem}_{timestamp}.json"
         filepath = os.path.join(self.config.output_directory, filename)
         
         try:
-            with open(filepath, 'w') as f:
-                json.dump(test_report, f, indent=2, default=str)
+            data = dumps_json(test_report, default=str)
             
-            self.logger.info(f"Test report saved to: {filepath}")
+            # Directory creation and the write block, keep them off the event loop
+            loop = asyncio.get_running_loop()
+            filepath = await loop.run_in_executor(None, self._write_report_blocking, filepath, data)
+            
+            self.logger.info("Test report saved to: %s", filepath)
             
         except Exception as e:
-            self.logger.error(f"Failed to save test report: {str(e)}")
+            self.logger.error("Failed to save test report: %s", str(e))
+    
+    @staticmethod
+    def _write_report_blocking(filepath: str, data: str) -> str:
+        """Write a serialized report, creating its directory if needed
+        
+        Report names only have second resolution, a report finishing in the
+        same second as another gets a numbered suffix instead of replacing it.
+        Returns the path actually written.
+        """
+        
+        os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+        stem, ext = os.path.splitext(filepath)
+        path, attempt = filepath, 1
+        while True:
+            try:
+                with open(path, 'x', encoding='utf-8') as f:
+                    f.write(data)
+                return path
+            except FileExistsError:
+                path = f"{stem}_{attempt}{ext}"
+                attempt += 1
     
     def get_test_summary(self) -> Dict[str, Any]:
         """Get test execution summary"""
         
+        metrics = self.overall_metrics
         return {
             "execution_id": self.test_execution_id,
-            "suite_type": self.config.suite_type.value,
-            "total_scenarios": self.overall_metrics.get("total_scenarios", 0),
-            "successful_scenarios": self.overall_metrics.get("successful_scenarios", 0),
-            "failed_scenarios": self.overall_metrics.get("failed_scenarios", 0),
-            "success_rate": f"{self.overall_metrics.get('success_rate', 0.0):.2%}",
+            "suite_type": self._suite_type_value,
+            "total_scenarios": metrics.get("total_scenarios", 0),
+            "successful_scenarios": metrics.get("successful_scenarios", 0),
+            "failed_scenarios": metrics.get("failed_scenarios", 0),
+            "success_rate": f"{metrics.get('success_rate', 0.0):.2%}",
             "overall_quality": self._assess_overall_quality(),
-            "execution_time": str(self.execution_end - self.execution_start) if self.execution_end and self.execution_start else None
+            "execution_time": self._total_duration_str
         }
 
 
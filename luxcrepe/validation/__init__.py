@@ -1,19 +1,38 @@
 # Luxcrepe-SEADOG Validation System
+#
+# The validator pulls in the whole integration stack, so its names are
+# resolved lazily on first access (PEP 562) rather than at package import.
 
-from .real_world_validator import (
-    RealWorldValidator,
-    ValidationTarget,
-    ValidationResult,
-    run_quick_validation,
-    validate_ecommerce_sites,
-    validate_api_endpoints
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .real_world_validator import (
+        RealWorldValidator,
+        ValidationTarget,
+        ValidationResult,
+        run_quick_validation,
+        validate_ecommerce_sites,
+        validate_api_endpoints
+    )
 
 __all__ = [
     "RealWorldValidator",
     "ValidationTarget",
-    "ValidationResult", 
+    "ValidationResult",
     "run_quick_validation",
     "validate_ecommerce_sites",
     "validate_api_endpoints"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        from . import real_world_validator
+        value = getattr(real_world_validator, name)
+        globals()[name] = value  # later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,28 +6,41 @@ Test the integrated system against real websites with comprehensive validation
 import asyncio
 import logging
 import time
-import json
-from typing import Dict, Any, List, Optional, Tuple
-from datetime import datetime
-from dataclasses import dataclass, asdict
+from collections import Counter
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+from datetime import datetime, timedelta
+from dataclasses import dataclass, fields, is_dataclass
+from functools import lru_cache
+
+import numpy as np
 
 from ..integration import LuxcrepeSEADOGIntegration, IntegrationConfig
 from ..config import get_seadog_configurations, TargetType
+from ..core.utils import dumps_json
+from ..tests.base_agent import DATACLASS_SLOTS
+
+
+# Below this many scraped products the plain Python scoring loop is cheaper than NumPy
+_NUMPY_MIN_PRODUCTS = 64
 
+# Minimum gap in seconds between validations hitting the same host
+_HOST_MIN_INTERVAL = 2.0
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ValidationTarget:
     """Real-world validation target definition"""
     url: str
     target_type: TargetType
     description: str
-    expected_data_fields: List[str]
+    expected_data_fields: Tuple[str, ...]
     validation_criteria: Dict[str, Any]
     risk_level: str
     test_notes: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ValidationResult:
     """Validation result for a specific target"""
     target: ValidationTarget
@@ -42,6 +55,80 @@ class ValidationResult:
     error_details: Optional[str]
 
 
+def _report_dict(obj: Any) -> Dict[str, Any]:
+    """Convert a validation dataclass for a report without asdict's deep copy of nested results"""
+    
+    report = {}
+    for field_ in fields(obj):
+        value = getattr(obj, field_.name)
+        report[field_.name] = _report_dict(value) if is_dataclass(value) else value
+    return report
+
+
+def _failed_result(target: ValidationTarget, failed_check: str, error_details: str,
+                   performance_metrics: Dict[str, Any]) -> ValidationResult:
+    """Build the result recorded for a target whose validation raised"""
+    
+    return ValidationResult(
+        target=target,
+        test_timestamp=datetime.now(),
+        integration_results=None,
+        seadog_results=None,
+        validation_score=0.0,
+        passed_checks=[],
+        failed_checks=[failed_check],
+        performance_metrics=performance_metrics,
+        recommendations=["Investigate validation failure"],
+        error_details=error_details
+    )
+
+
+@lru_cache(maxsize=None)
+def _resolve_integration_config(target_type: TargetType) -> IntegrationConfig:
+    """Return the integration config used to validate a target type, resolved once per type"""
+    
+    # Use the first suitable configuration with LOW or MINIMAL risk
+    for config in get_seadog_configurations().get_configurations_by_target_type(target_type):
+        if config.risk_assessment in ("MINIMAL", "LOW"):
+            return config.integration_config
+    
+    return _fallback_integration_config()
+
+
+@lru_cache(maxsize=1)
+def _fallback_integration_config() -> IntegrationConfig:
+    """Return the default safe integration config, built once"""
+    
+    return IntegrationConfig(
+        intelligence_enabled=True,
+        real_time_monitoring=True,
+        test_suite_type="RECONNAISSANCE",
+        parallel_execution=False,  # Sequential for safety
+        timeout_minutes=10
+    )
+
+
+def _integration_pool_key(integration_config: Any) -> Optional[Tuple[Any, ...]]:
+    """Key integrations with equal settings share, None if the config cannot be pooled"""
+    
+    if not isinstance(integration_config, IntegrationConfig):
+        return None
+    
+    key = tuple(getattr(integration_config, field_.name) for field_ in fields(integration_config))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+@dataclass(**DATACLASS_SLOTS)
+class _HostLimiter:
+    """Per-host politeness gate, one validation at a time and spaced apart"""
+    semaphore: asyncio.Semaphore
+    last_hit: float = float("-inf")
+
+
 class RealWorldValidator:
     """Real-world validation system for SEADOG-Luxcrepe integration"""
     
@@ -60,6 +147,13 @@ class RealWorldValidator:
             "min_stealth_score": 0.8
         }
         
+        # Thresholds read on every target evaluation, bound once
+        self._max_avg_response_time = self.validation_criteria["max_avg_response_time"]
+        self._min_success_rate = self.validation_criteria["min_success_rate"]
+        
+        # Politeness gates, keyed by host so unrelated hosts run concurrently
+        self._host_limiters: Dict[str, _HostLimiter] = {}
+        
         self.logger.info("Real-world validator initialized")
     
     def _initialize_validation_targets(self) -> List[ValidationTarget]:
@@ -72,7 +166,7 @@ class RealWorldValidator:
             url="https://demo.opencart.com/",
             target_type=TargetType.ECOMMERCE,
             description="OpenCart Demo Store - E-commerce testing",
-            expected_data_fields=["name", "price", "description", "image"],
+            expected_data_fields=("name", "price", "description", "image"),
             validation_criteria={
                 "min_products_found": 10,
                 "product_completeness_rate": 0.8,
@@ -87,7 +181,7 @@ class RealWorldValidator:
             url="https://jsonplaceholder.typicode.com/",
             target_type=TargetType.API_ENDPOINT,
             description="JSONPlaceholder API - API endpoint testing",
-            expected_data_fields=["title", "body", "userId", "id"],
+            expected_data_fields=("title", "body", "userId", "id"),
             validation_criteria={
                 "api_response_validation": True,
                 "json_structure_compliance": True,
@@ -102,7 +196,7 @@ class RealWorldValidator:
             url="https://httpbin.org/",
             target_type=TargetType.API_ENDPOINT,
             description="HTTPBin - HTTP testing service",
-            expected_data_fields=["headers", "origin", "url"],
+            expected_data_fields=("headers", "origin", "url"),
             validation_criteria={
                 "http_methods_support": True,
                 "header_handling": True,
@@ -116,7 +210,8 @@ class RealWorldValidator:
     
     async def run_comprehensive_validation(self, 
                                          target_filter: Optional[TargetType] = None,
-                                         max_targets: int = 3) -> Dict[str, Any]:
+                                         max_targets: int = 3,
+                                         max_concurrency: int = 3) -> Dict[str, Any]:
         """Run comprehensive validation against real-world targets"""
         
         self.logger.info("Starting comprehensive real-world validation")
@@ -129,7 +224,6 @@ class RealWorldValidator:
         # Limit number of targets
         targets_to_test = targets_to_test[:max_targets]
         
-        validation_results = []
         overall_metrics = {
             "total_targets": len(targets_to_test),
             "successful_validations": 0,
@@ -138,110 +232,147 @@ class RealWorldValidator:
             "total_validation_time": 0.0,
             "start_time": datetime.now()
         }
+        # Durations are measured on the monotonic clock, the datetimes are for display
+        run_start = time.monotonic()
+        
+        # Targets are independent and I/O-bound, validate them concurrently
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        # One started integration per distinct config settings, shared by the targets using them.
+        # An integration keeps per-run state (its test runner, second-resolution mission IDs),
+        # so the targets sharing one take turns through its lock.
+        integrations: Dict[Any, asyncio.Future] = {}
+        integration_locks: Dict[Any, asyncio.Lock] = {}
+        
+        def _shared_integration(target: ValidationTarget) -> Tuple[asyncio.Future, asyncio.Lock]:
+            integration_config = _resolve_integration_config(target.target_type)
+            key = _integration_pool_key(integration_config)
+            if key is None:
+                # Not safely poolable, give the target an integration of its own
+                key = ("UNPOOLED", id(target))
+            if key not in integrations:
+                integrations[key] = asyncio.ensure_future(self._start_integration(integration_config))
+                integration_locks[key] = asyncio.Lock()
+            return integrations[key], integration_locks[key]
+        
+        async def _run_one(target: ValidationTarget) -> ValidationResult:
+            async with semaphore:
+                start_time = time.monotonic()
+                try:
+                    self.logger.info(f"Validating target: {target.description}")
+                    
+                    started, integration_lock = _shared_integration(target)
+                    integration = await started
+                    result = await self._validate_single_target(target, integration, integration_lock)
+                    result.performance_metrics["validation_time"] = time.monotonic() - start_time
+                    
+                    self.logger.info(f"Target validation completed: {target.description} - Score: {result.validation_score:.2f}")
+                    return result
+                    
+                except Exception as e:
+                    self.logger.error(f"Validation failed for {target.description}: {str(e)}")
+                    
+                    # Create failed result
+                    return _failed_result(
+                        target, "VALIDATION_EXECUTION_FAILED", str(e),
+                        {"validation_time": time.monotonic() - start_time}
+                    )
         
         # Test each target
-        for target in targets_to_test:
-            try:
-                self.logger.info(f"Validating target: {target.description}")
-                
-                start_time = time.time()
-                result = await self._validate_single_target(target)
-                validation_time = time.time() - start_time
-                
-                result.performance_metrics["validation_time"] = validation_time
-                validation_results.append(result)
-                
-                if result.validation_score >= 0.7:
-                    overall_metrics["successful_validations"] += 1
-                else:
-                    overall_metrics["failed_validations"] += 1
-                
-                overall_metrics["total_validation_time"] += validation_time
-                
-                self.logger.info(f"Target validation completed: {target.description} - Score: {result.validation_score:.2f}")
-                
-                # Brief pause between targets to be respectful
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                self.logger.error(f"Validation failed for {target.description}: {str(e)}")
-                
-                # Create failed result
-                failed_result = ValidationResult(
-                    target=target,
-                    test_timestamp=datetime.now(),
-                    integration_results=None,
-                    seadog_results=None,
-                    validation_score=0.0,
-                    passed_checks=[],
-                    failed_checks=["VALIDATION_EXECUTION_FAILED"],
-                    performance_metrics={"validation_time": time.time() - start_time},
-                    recommendations=["Investigate validation failure"],
-                    error_details=str(e)
-                )
-                validation_results.append(failed_result)
+        try:
+            validation_results = await asyncio.gather(*[_run_one(target) for target in targets_to_test])
+        finally:
+            await self._stop_integrations(integrations.values())
+        
+        # Aggregate everything the summary and recommendations need in one pass
+        failure_counts = Counter()
+        high_scoring = low_scoring = 0
+        score_total = 0.0
+        for result in validation_results:
+            score = result.validation_score
+            score_total += score
+            if score >= 0.7:
+                overall_metrics["successful_validations"] += 1
+            else:
                 overall_metrics["failed_validations"] += 1
+            
+            if score >= 0.8:
+                high_scoring += 1
+            elif score < 0.5:
+                low_scoring += 1
+            
+            failure_counts.update(result.failed_checks)
+            
+            # Failed executions are not counted towards validation time
+            if result.error_details is None:
+                overall_metrics["total_validation_time"] += result.performance_metrics["validation_time"]
         
         # Calculate overall metrics
         if validation_results:
-            overall_metrics["average_validation_score"] = sum(
-                r.validation_score for r in validation_results
-            ) / len(validation_results)
+            overall_metrics["average_validation_score"] = score_total / len(validation_results)
         
         overall_metrics["end_time"] = datetime.now()
-        overall_metrics["total_duration"] = str(overall_metrics["end_time"] - overall_metrics["start_time"])
+        overall_metrics["total_duration"] = str(timedelta(seconds=time.monotonic() - run_start))
         
         # Generate comprehensive report
         validation_report = {
             "validation_id": f"REALWORLD_VALIDATION_{int(time.time())}",
             "overall_metrics": overall_metrics,
-            "target_results": [asdict(result) for result in validation_results],
-            "summary": self._generate_validation_summary(validation_results, overall_metrics),
-            "recommendations": self._generate_overall_recommendations(validation_results)
+            "target_results": [_report_dict(result) for result in validation_results],
+            "summary": self._generate_validation_summary(
+                overall_metrics, failure_counts, high_scoring, low_scoring
+            ),
+            "recommendations": self._generate_overall_recommendations(
+                validation_results, failure_counts, overall_metrics["average_validation_score"]
+            )
         }
         
         self.logger.info("Comprehensive validation completed")
         return validation_report
     
-    async def _validate_single_target(self, target: ValidationTarget) -> ValidationResult:
-        """Validate a single target using SEADOG integration"""
-        
-        # Get appropriate configuration for target type
-        configs = get_seadog_configurations()
-        suitable_configs = configs.get_configurations_by_target_type(target.target_type)
-        
-        # Use the first suitable configuration with LOW or MINIMAL risk
-        integration_config = None
-        for config in suitable_configs:
-            if config.risk_assessment in ["MINIMAL", "LOW"]:
-                integration_config = config.integration_config
-                break
-        
-        if not integration_config:
-            # Fallback to default safe configuration
-            integration_config = IntegrationConfig(
-                intelligence_enabled=True,
-                real_time_monitoring=True,
-                test_suite_type="RECONNAISSANCE",
-                parallel_execution=False,  # Sequential for safety
-                timeout_minutes=10
-            )
+    async def _validate_single_target(self, target: ValidationTarget,
+                                      integration: Optional[LuxcrepeSEADOGIntegration] = None,
+                                      integration_lock: Optional[asyncio.Lock] = None) -> ValidationResult:
+        """Validate a single target using SEADOG integration
         
-        # Create integration instance
-        integration = LuxcrepeSEADOGIntegration(integration_config)
+        An already started ``integration`` is used as is, otherwise one is
+        created for the target type and stopped again afterwards. A shared
+        integration comes with ``integration_lock``, held while it is in use.
+        """
+        
+        owns_integration = integration is None
+        if owns_integration:
+            # Create integration instance with the configuration for the target type
+            integration = LuxcrepeSEADOGIntegration(_resolve_integration_config(target.target_type))
         
         try:
-            await integration.start_integration()
+            if owns_integration:
+                await integration.start_integration()
             
-            # Run integrated scrape test with light intensity
-            integration_results = await integration.integrated_scrape_with_testing(
-                target.url, 
-                enable_testing=True, 
-                test_intensity="LIGHT"  # Use light intensity for safety
-            )
+            if integration_lock is None:
+                integration_lock = asyncio.Lock()
             
-            # Run SEADOG reconnaissance
-            seadog_results = await integration.execute_mission_test([target.url], "RECONNAISSANCE")
+            # Be respectful, one validation per host at a time and spaced apart.
+            # Every target takes the integration lock before the host gate, so the two never deadlock.
+            limiter = self._limiter_for(target.url)
+            async with integration_lock, limiter.semaphore:
+                loop = asyncio.get_running_loop()
+                wait = _HOST_MIN_INTERVAL - (loop.time() - limiter.last_hit)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                
+                try:
+                    # Run integrated scrape test with light intensity
+                    integration_results = await integration.integrated_scrape_with_testing(
+                        target.url, 
+                        enable_testing=True, 
+                        test_intensity="LIGHT"  # Use light intensity for safety
+                    )
+                    
+                    # Run SEADOG reconnaissance
+                    seadog_results = await integration.execute_mission_test([target.url], "RECONNAISSANCE")
+                finally:
+                    limiter.last_hit = loop.time()
             
             # Validate results
             validation_score, passed_checks, failed_checks = self._evaluate_target_results(
@@ -267,7 +398,39 @@ class RealWorldValidator:
             )
             
         finally:
-            await integration.stop_integration()
+            if owns_integration:
+                await integration.stop_integration()
+    
+    async def _start_integration(self, integration_config: IntegrationConfig) -> LuxcrepeSEADOGIntegration:
+        """Create and start an integration to be shared across targets"""
+        
+        integration = LuxcrepeSEADOGIntegration(integration_config)
+        await integration.start_integration()
+        return integration
+    
+    async def _stop_integrations(self, started: Iterable[asyncio.Future]):
+        """Stop the shared integrations that were started successfully"""
+        
+        for future in started:
+            if not future.done():
+                future.cancel()
+                continue
+            if future.cancelled() or future.exception() is not None:
+                continue
+            
+            try:
+                await future.result().stop_integration()
+            except Exception as e:
+                self.logger.error(f"Failed to stop integration: {str(e)}")
+    
+    def _limiter_for(self, url: str) -> _HostLimiter:
+        """Get the politeness gate for the host of a URL"""
+        
+        host = urlsplit(url).netloc
+        limiter = self._host_limiters.get(host)
+        if limiter is None:
+            limiter = self._host_limiters[host] = _HostLimiter(asyncio.Semaphore(1))
+        return limiter
     
     def _evaluate_target_results(self, target: ValidationTarget, 
                                integration_results: Dict[str, Any],
@@ -306,7 +469,7 @@ class RealWorldValidator:
                 passed_checks.append("PERFORMANCE_SUCCESS")
                 
                 execution_time = perf_metrics.get("total_execution_time", 0)
-                if execution_time <= self.validation_criteria["max_avg_response_time"]:
+                if execution_time <= self._max_avg_response_time:
                     passed_checks.append("ACCEPTABLE_RESPONSE_TIME")
                     score_components.append(0.1)
                 else:
@@ -324,7 +487,7 @@ class RealWorldValidator:
             overall_metrics = seadog_results.get("overall_metrics", {})
             success_rate = overall_metrics.get("success_rate", 0)
             
-            if success_rate >= self.validation_criteria["min_success_rate"]:
+            if success_rate >= self._min_success_rate:
                 passed_checks.append("ACCEPTABLE_SUCCESS_RATE")
                 score_components.append(success_rate * 0.1)
             else:
@@ -345,12 +508,23 @@ class RealWorldValidator:
         if not scraping_results:
             return 0.0
         
-        quality_scores = []
         expected_fields = target.expected_data_fields
-        
-        for product in scraping_results:
-            field_completeness = sum(1 for field in expected_fields if product.get(field)) / len(expected_fields)
-            quality_scores.append(field_completeness)
+        n_fields = len(expected_fields)
+        
+        if n_fields and len(scraping_results) >= _NUMPY_MIN_PRODUCTS:
+            # Field presence matrix, one row per product
+            presence = np.fromiter(
+                (1 if product.get(field) else 0 for product in scraping_results for field in expected_fields),
+                dtype=np.uint8,
+                count=len(scraping_results) * n_fields
+            ).reshape(len(scraping_results), n_fields)
+            return float(presence.mean(axis=1).mean())
+        
+        # Count present fields with C-level map calls instead of a generator per product
+        quality_scores = [
+            sum(map(bool, map(product.get, expected_fields))) / n_fields
+            for product in scraping_results
+        ]
         
         return sum(quality_scores) / len(quality_scores) if quality_scores else 0.0
     
@@ -390,8 +564,9 @@ class RealWorldValidator:
         
         return recommendations[:5]  # Limit to top 5 recommendations
     
-    def _generate_validation_summary(self, validation_results: List[ValidationResult],
-                                   overall_metrics: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_validation_summary(self, overall_metrics: Dict[str, Any],
+                                   failure_counts: Counter,
+                                   high_scoring: int, low_scoring: int) -> Dict[str, Any]:
         """Generate validation summary"""
         
         summary = {
@@ -404,56 +579,42 @@ class RealWorldValidator:
         }
         
         # Analyze results for key findings
-        high_scoring_targets = [r for r in validation_results if r.validation_score >= 0.8]
-        low_scoring_targets = [r for r in validation_results if r.validation_score < 0.5]
+        if high_scoring:
+            summary["key_findings"].append(f"{high_scoring} targets achieved high validation scores")
         
-        if high_scoring_targets:
-            summary["key_findings"].append(f"{len(high_scoring_targets)} targets achieved high validation scores")
-        
-        if low_scoring_targets:
-            summary["critical_issues"].append(f"{len(low_scoring_targets)} targets failed validation")
+        if low_scoring:
+            summary["critical_issues"].append(f"{low_scoring} targets failed validation")
         
         # Common failure patterns
-        common_failures = {}
-        for result in validation_results:
-            for failure in result.failed_checks:
-                common_failures[failure] = common_failures.get(failure, 0) + 1
-        
-        if common_failures:
-            most_common_failure = max(common_failures.items(), key=lambda x: x[1])
+        if failure_counts:
+            most_common_failure = failure_counts.most_common(1)[0]
             summary["critical_issues"].append(f"Most common failure: {most_common_failure[0]} ({most_common_failure[1]} targets)")
         
         return summary
     
-    def _generate_overall_recommendations(self, validation_results: List[ValidationResult]) -> List[str]:
+    def _generate_overall_recommendations(self, validation_results: List[ValidationResult],
+                                          failure_counts: Counter,
+                                          avg_score: float) -> List[str]:
         """Generate overall recommendations from all validation results"""
         
         recommendations = []
         
         # Analyze overall performance
-        avg_score = sum(r.validation_score for r in validation_results) / len(validation_results) if validation_results else 0
-        
         if avg_score < 0.7:
             recommendations.append("URGENT: Overall validation score below acceptable threshold")
         
-        # Count failure types
-        failure_counts = {}
-        for result in validation_results:
-            for failure in result.failed_checks:
-                failure_counts[failure] = failure_counts.get(failure, 0) + 1
-        
         # Recommend improvements for common failures
-        if failure_counts.get("NO_DATA_EXTRACTED", 0) > 1:
+        if failure_counts["NO_DATA_EXTRACTED"] > 1:
             recommendations.append("Improve data extraction reliability across target types")
         
-        if failure_counts.get("SLOW_RESPONSE_TIME", 0) > 1:
+        if failure_counts["SLOW_RESPONSE_TIME"] > 1:
             recommendations.append("Optimize system performance and response times")
         
-        if failure_counts.get("LOW_SUCCESS_RATE", 0) > 1:
+        if failure_counts["LOW_SUCCESS_RATE"] > 1:
             recommendations.append("Enhance SEADOG agent reliability and error handling")
         
         # Target-specific recommendations
-        target_types = [r.target.target_type for r in validation_results]
+        target_types = {r.target.target_type for r in validation_results}
         if TargetType.ECOMMERCE in target_types:
             recommendations.append("Consider specialized e-commerce optimization configurations")
         
@@ -479,7 +640,7 @@ class RealWorldValidator:
             url=target_url,
             target_type=TargetType.UNKNOWN,
             description=f"Quick validation: {target_url}",
-            expected_data_fields=["title", "content"],
+            expected_data_fields=("title", "content"),
             validation_criteria={"basic_extraction": True},
             risk_level="UNKNOWN",
             test_notes="Quick validation target"
@@ -489,11 +650,27 @@ class RealWorldValidator:
     
     def export_validation_report(self, validation_report: Dict[str, Any], 
                                filepath: str, format: str = "json"):
-        """Export validation report to file"""
-        
-        if format.lower() == "json":
-            with open(filepath, 'w') as f:
-                json.dump(validation_report, f, indent=2, default=str)
+        """Export validation report to file
+        
+        ``json`` writes the whole report, ``ndjson`` writes one compact line
+        per target result so large reports can be streamed back in. A report
+        without target results raises ValueError for ``ndjson``.
+        """
+        
+        format = format.lower()
+        if format == "json":
+            data = dumps_json(validation_report, default=str)
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write(data)
+        elif format == "ndjson":
+            # Comprehensive reports carry "target_results", quick validation reports "results"
+            entries = validation_report.get("target_results") or validation_report.get("results")
+            if not entries:
+                raise ValueError("Validation report has no target results to export as ndjson")
+            with open(filepath, 'w', encoding='utf-8') as f:
+                for entry in entries:
+                    f.write(dumps_json(entry, indent=False, default=str))
+                    f.write("\n")
         else:
             raise ValueError(f"Unsupported format: {format}")
         
@@ -513,31 +690,20 @@ async def run_quick_validation(target_urls: List[str]) -> Dict[str, Any]:
             results.append(result)
         except Exception as e:
             # Create failed result
-            failed_result = ValidationResult(
-                target=ValidationTarget(
-                    url=url,
-                    target_type=TargetType.UNKNOWN,
-                    description=f"Quick validation: {url}",
-                    expected_data_fields=[],
-                    validation_criteria={},
-                    risk_level="UNKNOWN",
-                    test_notes="Quick validation failed"
-                ),
-                test_timestamp=datetime.now(),
-                integration_results=None,
-                seadog_results=None,
-                validation_score=0.0,
-                passed_checks=[],
-                failed_checks=["VALIDATION_FAILED"],
-                performance_metrics={},
-                recommendations=["Investigate validation failure"],
-                error_details=str(e)
+            failed_target = ValidationTarget(
+                url=url,
+                target_type=TargetType.UNKNOWN,
+                description=f"Quick validation: {url}",
+                expected_data_fields=(),
+                validation_criteria={},
+                risk_level="UNKNOWN",
+                test_notes="Quick validation failed"
             )
-            results.append(failed_result)
+            results.append(_failed_result(failed_target, "VALIDATION_FAILED", str(e), {}))
     
     return {
         "validation_type": "QUICK_VALIDATION",
-        "results": [asdict(r) for r in results],
+        "results": [_report_dict(r) for r in results],
         "summary": {
             "total_urls": len(target_urls),
             "successful_validations": sum(1 for r in results if r.validation_score > 0.5),
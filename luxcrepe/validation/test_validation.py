@@ -6,10 +6,10 @@ Test the integrated system against safe, public testing endpoints
 
 import asyncio
 import logging
-import json
 import sys
 from datetime import datetime
 
+from ..core.utils import dumps_json
 from .real_world_validator import (
     RealWorldValidator, 
     run_quick_validation,
@@ -17,6 +17,13 @@ from .real_world_validator import (
 )
 
 
+def _write_results(results_file: str, data: str):
+    """Write serialized results, run in an executor to keep the event loop free"""
+    
+    with open(results_file, 'w', encoding='utf-8') as f:
+        f.write(data)
+
+
 async def run_basic_validation_test():
     """Run basic validation test against safe endpoints"""
     
@@ -77,8 +84,9 @@ async def run_basic_validation_test():
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         results_file = f"validation_results_{timestamp}.json"
         
-        with open(results_file, 'w') as f:
-            json.dump(api_results, f, indent=2, default=str)
+        data = dumps_json(api_results, default=str)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, _write_results, results_file, data)
         
         print(f"\n💾 Results saved to: {results_file}")
         
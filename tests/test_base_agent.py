@@ -0,0 +1,60 @@
+"""
+Tests for BaseAgent message dispatch
+"""
+
+import asyncio
+
+from luxcrepe.tests.base_agent import BaseAgent, message_handler
+from luxcrepe.tests.agents.alpha.communications import CommunicationsAgent, MessageType
+
+
+class _Agent(BaseAgent):
+    def __init__(self):
+        super().__init__(agent_id="TEST-001", call_sign="TESTER", squad="test")
+        self.received = []
+    
+    async def execute_mission(self, mission_parameters):
+        return {}
+    
+    def get_capabilities(self):
+        return []
+    
+    @message_handler("PING")
+    async def _handle_ping(self, sender_id, message):
+        self.received.append(("class", sender_id, message["type"]))
+
+
+def test_receive_message_dispatches_registered_handler():
+    agent = _Agent()
+    
+    asyncio.run(agent.receive_message("ALPHA-001", {"type": "PING"}))
+    
+    assert agent.received == [("class", "ALPHA-001", "PING")]
+
+
+def test_instance_message_handlers_take_precedence():
+    agent = _Agent()
+    
+    async def ping(sender_id, message):
+        agent.received.append(("instance", sender_id, message["type"]))
+    
+    async def pong(sender_id, message):
+        agent.received.append(("instance", sender_id, message["type"]))
+    
+    agent.message_handlers["PING"] = ping
+    agent.message_handlers["PONG"] = pong
+    
+    async def run():
+        await agent.receive_message("ALPHA-001", {"type": "PING"})
+        await agent.receive_message("ALPHA-001", {"type": "PONG"})
+    
+    asyncio.run(run())
+    
+    assert agent.received == [("instance", "ALPHA-001", "PING"), ("instance", "ALPHA-001", "PONG")]
+
+
+def test_registries_are_per_class():
+    assert _Agent._HANDLERS == {"PING": "_handle_ping"}
+    assert BaseAgent._HANDLERS == {}
+    assert CommunicationsAgent._HANDLERS[MessageType.SITREP] == "_handle_sitrep"
+    assert len(CommunicationsAgent._HANDLERS) == 6
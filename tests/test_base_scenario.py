@@ -0,0 +1,39 @@
+"""
+Tests for BaseScenario metrics
+"""
+
+from luxcrepe.tests.scenarios.base_scenario import BaseScenario, ScenarioType
+
+
+class _Scenario(BaseScenario):
+    def __init__(self):
+        super().__init__("TEST_SCENARIO", ScenarioType.RECONNAISSANCE)
+    
+    async def setup_scenario(self):
+        return True
+    
+    async def execute_scenario(self):
+        return None
+    
+    async def validate_results(self):
+        return {}
+    
+    async def cleanup_scenario(self):
+        return True
+
+
+def test_performance_metrics_follow_in_place_result_edits():
+    scenario = _Scenario()
+    agent_results = [
+        {"status": "COMPLETED", "execution_time": 1.0},
+        {"status": "COMPLETED", "execution_time": 3.0},
+    ]
+    
+    assert scenario.calculate_performance_metrics(agent_results)["successful_agents"] == 2
+    
+    agent_results[1]["status"] = "FAILED"
+    agent_results[1]["execution_time"] = 5.0
+    
+    metrics = scenario.calculate_performance_metrics(agent_results)
+    assert metrics["successful_agents"] == 1
+    assert metrics["max_execution_time"] == 5.0
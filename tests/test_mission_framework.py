@@ -0,0 +1,152 @@
+"""
+Tests for MissionOrchestrator mission tracking
+"""
+
+import asyncio
+from datetime import timedelta
+
+from luxcrepe.tests.base_agent import MissionStatus
+from luxcrepe.tests.mission_framework import (
+    MissionOrchestrator,
+    MissionParameters,
+    MissionType,
+    OperationSecurity,
+    SQLiteMissionStore
+)
+
+
+def _mission(mission_id: str) -> MissionParameters:
+    return MissionParameters(
+        mission_id=mission_id,
+        mission_type=MissionType.DIRECT_ACTION,
+        target_system="https://example.com",
+        objectives=[],
+        success_criteria={},
+        time_limit=timedelta(minutes=1),
+        security_level=OperationSecurity.UNCLASSIFIED,
+        resources_required=[],
+        threat_assessment={},
+        rules_of_engagement={},
+        extraction_plan={}
+    )
+
+
+def _orchestrator(phase_delays) -> MissionOrchestrator:
+    """Orchestrator whose mission phases just sleep, one delay per execute_mission call"""
+    orchestrator = MissionOrchestrator()
+    delays = iter(phase_delays)
+    
+    async def phases(mission_params, selected_agents):
+        await asyncio.sleep(next(delays))
+        return {"phases": "done"}
+    
+    orchestrator._validate_agent_selection = lambda agent_ids, mission_params: True
+    orchestrator._execute_mission_phases = phases
+    return orchestrator
+
+
+def test_rerun_of_running_mission_keeps_status_counts():
+    # The first run finishes after the re-run replaced its record
+    orchestrator = _orchestrator([0.05, 0.01])
+    
+    async def run():
+        first = asyncio.ensure_future(orchestrator.execute_mission(_mission("M1"), ["AGENT"]))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(orchestrator.execute_mission(_mission("M1"), ["AGENT"]))
+        return await asyncio.gather(first, second)
+    
+    results = asyncio.run(run())
+    
+    assert [r["status"] for r in results] == ["SUCCESS", "SUCCESS"]
+    assert orchestrator._mission_status_counts == {"ACTIVE": 0, "COMPLETED": 1, "FAILED": 0}
+    assert list(orchestrator.active_missions) == ["M1"]
+
+
+def test_rerun_of_finished_mission_replaces_its_count():
+    orchestrator = _orchestrator([0, 0])
+    
+    async def run():
+        await orchestrator.execute_mission(_mission("M1"), ["AGENT"])
+        await orchestrator.execute_mission(_mission("M1"), ["AGENT"])
+    
+    asyncio.run(run())
+    
+    assert orchestrator._mission_status_counts == {"ACTIVE": 0, "COMPLETED": 1, "FAILED": 0}
+
+
+def test_replaced_record_is_not_persisted_over_the_rerun():
+    written = []
+    
+    class Store:
+        async def put(self, mission_id, record):
+            written.append((mission_id, record["status"], record["results"]))
+        
+        async def get(self, mission_id):
+            return None
+    
+    orchestrator = _orchestrator([0.05, 0.01])
+    orchestrator.store = Store()
+    
+    async def run():
+        first = asyncio.ensure_future(orchestrator.execute_mission(_mission("M1"), ["AGENT"]))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(orchestrator.execute_mission(_mission("M1"), ["AGENT"]))
+        await asyncio.gather(first, second)
+        await orchestrator.flush_store()
+        return second
+    
+    asyncio.run(run())
+    
+    # Two ACTIVE writes, then only the re-run's completion
+    assert [status for _, status, _ in written] == ["ACTIVE", "ACTIVE", "COMPLETED"]
+
+
+def test_eviction_skips_active_missions():
+    orchestrator = _orchestrator([0, 0, 0])
+    orchestrator.max_completed = 2
+    
+    async def run():
+        for mission_id in ("M1", "M2", "M3"):
+            await orchestrator.execute_mission(_mission(mission_id), ["AGENT"])
+    
+    asyncio.run(run())
+    
+    assert list(orchestrator.active_missions) == ["M2", "M3"]
+    assert orchestrator._mission_status_counts == {"ACTIVE": 0, "COMPLETED": 2, "FAILED": 0}
+
+
+def test_sqlite_store_built_outside_the_loop_serves_several_loops(tmp_path):
+    store = SQLiteMissionStore(str(tmp_path / "missions.db"))
+    
+    async def put_many(run):
+        await asyncio.gather(*[store.put(f"M{i}", {"run": run, "status": "COMPLETED"}) for i in range(5)])
+        return await store.get("M0")
+    
+    try:
+        assert asyncio.run(put_many(1)) == {"run": 1, "status": "COMPLETED"}
+        assert asyncio.run(put_many(2)) == {"run": 2, "status": "COMPLETED"}
+    finally:
+        store.close()
+
+
+def test_status_snapshots_show_current_agent_state():
+    orchestrator = _orchestrator([0])
+    
+    class Agent:
+        call_sign = "TESTER"
+        status = MissionStatus.STANDBY
+        
+        def get_mission_status(self):
+            return {"status": self.status.value}
+    
+    agent = Agent()
+    orchestrator.agent_registry = {"TEST-001": agent}
+    asyncio.run(orchestrator.execute_mission(_mission("M1"), ["TEST-001"]))
+    
+    assert orchestrator.get_mission_status("M1")["agents"] == {"TESTER": {"status": "STANDBY"}}
+    assert orchestrator.get_operational_status()["agents"]["standby"] == 1
+    
+    agent.status = MissionStatus.FAILED
+    
+    assert orchestrator.get_mission_status("M1")["agents"] == {"TESTER": {"status": "FAILED"}}
+    assert orchestrator.get_operational_status()["agents"]["failed"] == 1
@@ -0,0 +1,28 @@
+"""
+Tests for RealWorldValidator report export
+"""
+
+import json
+
+import pytest
+
+from luxcrepe.validation.real_world_validator import RealWorldValidator
+
+
+def test_ndjson_export_writes_one_line_per_target(tmp_path):
+    path = tmp_path / "report.ndjson"
+    report = {"target_results": [{"url": "https://example.com", "title": "東京 ☕"}, {"url": "https://example.org"}]}
+    
+    RealWorldValidator().export_validation_report(report, str(path), format="ndjson")
+    
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == report["target_results"]
+
+
+def test_ndjson_export_rejects_report_without_results(tmp_path):
+    path = tmp_path / "report.ndjson"
+    
+    with pytest.raises(ValueError):
+        RealWorldValidator().export_validation_report({"error": "failed"}, str(path), format="ndjson")
+    
+    assert not path.exists()
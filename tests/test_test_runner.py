@@ -0,0 +1,39 @@
+"""
+Tests for SEADOGTestRunner report output
+"""
+
+import asyncio
+import os
+from datetime import datetime
+
+from luxcrepe.tests.scenarios import test_runner
+
+
+class _Clock(datetime):
+    """datetime whose now() is set by the test"""
+    current = datetime(2026, 1, 1, 10, 0, 0)
+    
+    @classmethod
+    def now(cls, tz=None):
+        return cls.current
+
+
+def test_each_run_names_its_report_after_its_own_time(monkeypatch, tmp_path):
+    monkeypatch.setattr(test_runner, "datetime", _Clock)
+    config = test_runner.create_reconnaissance_test_config(["https://example.com"], str(tmp_path))
+    runner = test_runner.SEADOGTestRunner(config)
+    
+    async def no_scenarios():
+        pass
+    
+    runner._initialize_test_scenarios = no_scenarios
+    
+    _Clock.current = datetime(2026, 1, 1, 10, 0, 0)
+    asyncio.run(runner.run_test_suite())
+    _Clock.current = datetime(2026, 1, 1, 11, 30, 0)
+    asyncio.run(runner.run_test_suite())
+    
+    assert sorted(os.listdir(tmp_path)) == [
+        "seadog_test_report_reconnaissance_20260101_100000.json",
+        "seadog_test_report_reconnaissance_20260101_113000.json",
+    ]
@@ -0,0 +1,76 @@
+"""
+Tests for LuxCrepe utility functions
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import Enum
+
+import numpy as np
+import pytest
+
+from luxcrepe.core import utils
+from luxcrepe.config import TargetType
+
+
+class _Level(Enum):
+    LOW = 1
+
+
+@dataclass
+class _Check:
+    name: str
+    level: _Level
+
+
+class _Opaque:
+    def __str__(self):
+        return "opaque"
+
+
+def _report():
+    return {
+        "target_type": TargetType.ECOMMERCE,
+        "test_timestamp": datetime(2026, 1, 1, 1, 2, 3),
+        "end_time": datetime(2026, 1, 1, 1, 2, 3, 456789, tzinfo=timezone.utc),
+        "validation_score": np.float64(0.75),
+        "product_count": np.int64(12),
+        "checks": [_Check("price", _Level.LOW)],
+        "description": "Maison Margiela – prêt-à-porter",
+        "status_counts": {1: "COMPLETED", 2: "FAILED"},
+        "raw": _Opaque(),
+        "empty": {"list": [], "dict": {}},
+    }
+
+
+@pytest.mark.parametrize("indent", [True, False])
+def test_dumps_json_matches_with_and_without_orjson(monkeypatch, indent):
+    pytest.importorskip("orjson")
+    
+    with_orjson = utils.dumps_json(_report(), indent=indent, default=str)
+    monkeypatch.setattr(utils, "orjson", None)
+    without_orjson = utils.dumps_json(_report(), indent=indent, default=str)
+    
+    assert with_orjson == without_orjson
+
+
+def test_dumps_json_encodes_rich_types(monkeypatch):
+    monkeypatch.setattr(utils, "orjson", None)
+    
+    data = json.loads(utils.dumps_json(_report(), default=str))
+    
+    assert data["target_type"] == TargetType.ECOMMERCE.value
+    assert data["test_timestamp"] == "2026-01-01T01:02:03"
+    assert data["end_time"] == "2026-01-01T01:02:03.456789+00:00"
+    assert data["validation_score"] == 0.75
+    assert data["product_count"] == 12
+    assert data["checks"] == [{"name": "price", "level": 1}]
+    assert data["raw"] == "opaque"
+
+
+def test_dumps_json_without_default_rejects_unknown_types(monkeypatch):
+    monkeypatch.setattr(utils, "orjson", None)
+    
+    with pytest.raises(TypeError):
+        utils.dumps_json({"raw": _Opaque()})